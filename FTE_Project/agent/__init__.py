@@ -1,4 +1,4 @@
 """FTE Agent package"""
-from .brain import FTEAgent
+from .brain import FTEAgent, close_clients
 
-__all__ = ['FTEAgent']
+__all__ = ['FTEAgent', 'close_clients']
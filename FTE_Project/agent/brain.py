@@ -1,20 +1,123 @@
 """
 FTE Agent Brain - OpenRouter-powered agent with reasoning loop
 """
-import json
-from typing import Dict, List, Optional
-from openai import OpenAI
+import asyncio
+import re
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+import httpx
+import orjson
+from openai import AsyncOpenAI
+from pydantic import ValidationError
 
 from config import (
-    OPENROUTER_API_KEY,
-    OPENROUTER_MODEL,
     OPENROUTER_BASE_URL,
     AGENT_TEMPERATURE,
     AGENT_MAX_TOKENS,
+    AGENT_TIMEOUT,
+    TOOL_TIMEOUT,
+    TOOL_TIMEOUTS,
+    HTTP_MAX_CONNECTIONS,
+    HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    SKIP_SYNTHESIS,
+    VAULT_PROCESSED,
+    BATCH_BASE_URL,
+    BATCH_API_KEY,
+    BATCH_MODEL,
+    BATCH_COMPLETION_WINDOW,
+    BATCH_POLL_INTERVAL,
+    BATCH_MAX_POLL_INTERVAL,
+    CACHE_DIR,
+    EXACT_CACHE_ENABLED,
+    EXACT_CACHE_PATH,
+    EXACT_CACHE_TTL_HOURS,
+    SEMANTIC_CACHE_MODEL,
+    SEMANTIC_CACHE_THRESHOLD,
+    SEMANTIC_CACHE_TTL_HOURS,
+    ensure_vault_dirs,
+    get_settings,
     validate_config
 )
-from .prompts import SYSTEM_PROMPT, ANALYSIS_PROMPT
-from .tools import get_tool_definitions, execute_tool
+from .cache import ExactCache, SemanticCache, SEMANTIC_CACHE_AVAILABLE
+from .prompts import SYSTEM_PROMPT, ANALYSIS_PROMPT_PREFIX
+from .schema import Analysis, ANALYSIS_RESPONSE_FORMAT
+from .tools import TOOLS, get_tool_definitions, execute_tool, bound_tool_result
+
+# Messages shorter than this, with no request or question, only get
+# priority and category tools
+SHORT_MESSAGE_WORDS = 8
+
+# Imperative / request wording that can carry a task
+_ACTION_RE = re.compile(
+    r"\b(please|pls|need|needs|must|should|can you|could you|would you|"
+    r"make sure|remember|don't forget|send|review|update|call|schedule|"
+    r"prepare|check|fix|finish|complete|submit|follow up|deadline|due|todo)\b",
+    re.IGNORECASE
+)
+
+
+# API key -> (event loop, client); pooled connections belong to the loop
+# that opened them, so each loop gets its own client
+_CLIENTS = {}
+
+
+def _get_client(api_key: str) -> AsyncOpenAI:
+    """
+    Shared OpenRouter client per API key for the running event loop
+
+    Calls on the same loop reuse one connection pool, so keep-alive
+    connections survive across FTEAgent instances instead of paying a
+    TCP+TLS handshake each. A new loop (e.g. the next asyncio.run) gets a
+    fresh client, and clients left behind by closed loops are evicted.
+    """
+    loop = asyncio.get_running_loop()
+    cached = _CLIENTS.get(api_key)
+    if cached and cached[0] is loop:
+        return cached[1]
+
+    _evict_stale_clients()
+
+    client = AsyncOpenAI(
+        base_url=OPENROUTER_BASE_URL,
+        api_key=api_key,
+        http_client=httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                max_connections=HTTP_MAX_CONNECTIONS
+            ),
+            timeout=AGENT_TIMEOUT
+        )
+    )
+    _CLIENTS[api_key] = (loop, client)
+    return client
+
+
+def _evict_stale_clients():
+    """
+    Drop clients whose event loop has closed
+
+    Their connections died with the loop and can only be closed from it, so
+    the pool is released with the client. Keeps a watcher that calls
+    asyncio.run per message from piling up pools and dead loops; callers
+    that want a clean shutdown await close_clients() before their loop ends.
+    """
+    for api_key, (loop, _) in list(_CLIENTS.items()):
+        if loop.is_closed():
+            del _CLIENTS[api_key]
+
+
+async def close_clients():
+    """
+    Close the shared clients owned by the running event loop
+
+    Call before the loop ends (e.g. at the end of the coroutine passed to
+    asyncio.run) so its pooled connections are shut down cleanly.
+    """
+    loop = asyncio.get_running_loop()
+    for api_key, (owner, client) in list(_CLIENTS.items()):
+        if owner is loop:
+            del _CLIENTS[api_key]
+            await client.close()
 
 
 class FTEAgent:
@@ -31,23 +134,41 @@ class FTEAgent:
             api_key: OpenRouter API key (defaults to config)
             model: Model to use (defaults to config)
         """
-        self.api_key = api_key or OPENROUTER_API_KEY
-        self.model = model or OPENROUTER_MODEL
+        settings = get_settings()
+        self.api_key = api_key or settings.openrouter_api_key
+        self.model = model or settings.openrouter_model
 
         # Validate configuration
         if not self.api_key:
             validate_config()
 
-        # Initialize OpenAI client with OpenRouter
-        self.client = OpenAI(
-            base_url=OPENROUTER_BASE_URL,
-            api_key=self.api_key
-        )
-
         # Register tools
         self.tools = get_tool_definitions()
 
-    def analyze_message(self, message: str, sender: str = None) -> Dict:
+        # Exact-match response cache for byte-identical messages
+        self.exact_cache = None
+        if EXACT_CACHE_ENABLED:
+            self.exact_cache = ExactCache(
+                db_path=EXACT_CACHE_PATH,
+                ttl_seconds=EXACT_CACHE_TTL_HOURS * 3600
+            )
+
+        # Semantic response cache (optional - needs sentence-transformers + faiss-cpu)
+        self.semantic_cache = None
+        if settings.semantic_cache_enabled and SEMANTIC_CACHE_AVAILABLE:
+            self.semantic_cache = SemanticCache(
+                cache_dir=CACHE_DIR,
+                model_name=SEMANTIC_CACHE_MODEL,
+                threshold=SEMANTIC_CACHE_THRESHOLD,
+                ttl_seconds=SEMANTIC_CACHE_TTL_HOURS * 3600
+            )
+
+    @property
+    def client(self) -> AsyncOpenAI:
+        """Shared async OpenAI client with OpenRouter, for the running event loop"""
+        return _get_client(self.api_key)
+
+    async def analyze_message(self, message: str, sender: str = None) -> Dict:
         """
         Analyze a message using agent reasoning loop
 
@@ -59,67 +180,136 @@ class FTEAgent:
             Dict with structured analysis results
         """
         try:
-            # Prepare analysis prompt
-            user_prompt = ANALYSIS_PROMPT.format(message=message)
+            # Identical messages reuse a cached analysis
+            if self.exact_cache:
+                cached = self.exact_cache.lookup(message)
+                if cached:
+                    return self._from_cache(cached, message, sender)
+
+            # Near-duplicate messages reuse a cached analysis
+            embedding = None
+            if self.semantic_cache:
+                embedding = await asyncio.to_thread(self.semantic_cache.embed, message)
+                cached = self.semantic_cache.lookup(embedding)
+                if cached:
+                    return self._from_cache(cached, message, sender)
+
+            messages, message_obj, tool_results = await self._run_tools(message)
 
-            # Initial agent call with tools
-            messages = [
-                {"role": "system", "content": SYSTEM_PROMPT},
-                {"role": "user", "content": user_prompt}
-            ]
+            if message_obj.tool_calls:
+                if SKIP_SYNTHESIS:
+                    # Tools are deterministic - the output is built from their
+                    # results directly, saving a second round-trip
+                    output = self._structure_output(
+                        message=message,
+                        sender=sender,
+                        tool_results=tool_results,
+                        synthesis=None
+                    )
+                else:
+                    # Get final analysis from agent as schema-constrained JSON
+                    final_response = await self._create(
+                        "synthesis",
+                        model=self.model,
+                        messages=messages,
+                        temperature=AGENT_TEMPERATURE,
+                        max_tokens=AGENT_MAX_TOKENS,
+                        response_format=ANALYSIS_RESPONSE_FORMAT
+                    )
+
+                    output = self._parse_analysis(
+                        content=final_response.choices[0].message.content,
+                        message=message,
+                        sender=sender,
+                        tool_results=tool_results
+                    )
+            else:
+                # No tools called, use direct response
+                output = self._structure_output(
+                    message=message,
+                    sender=sender,
+                    tool_results=tool_results,
+                    synthesis=message_obj.content
+                )
 
-            # Agent reasoning loop
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                tools=self.tools,
-                tool_choice="auto",
-                temperature=AGENT_TEMPERATURE,
-                max_tokens=AGENT_MAX_TOKENS
-            )
+            if self.exact_cache:
+                self.exact_cache.store(message, output)
+            if self.semantic_cache:
+                await asyncio.to_thread(self.semantic_cache.store, embedding, output)
+
+            return output
+
+        except Exception as e:
+            return {
+                "error": str(e),
+                "message": message,
+                "sender": sender
+            }
 
-            # Process tool calls
-            tool_results = {}
-            message_obj = response.choices[0].message
+    async def analyze_message_stream(
+        self,
+        message: str,
+        sender: str = None,
+        partial_id: str = None
+    ) -> AsyncIterator[Dict]:
+        """
+        Analyze a message, streaming the synthesis as it is generated
+
+        Yields {"type": "delta", "content": str} events while the synthesis
+        streams in, then a final {"type": "result", "output": dict} event
+        with the structured analysis.
+
+        Args:
+            message: The message content to analyze
+            sender: Optional sender name
+            partial_id: If given, deltas are also appended to
+                        VAULT_PROCESSED/<partial_id>.partial.md while the
+                        stream runs; the file is removed once it ends
+
+        Yields:
+            Delta events, then the result event
+        """
+        partial_path = None
+        partial_file = None
+        if partial_id:
+            ensure_vault_dirs()
+            partial_path = VAULT_PROCESSED / f"{partial_id}.partial.md"
+            partial_file = open(partial_path, 'a', encoding='utf-8')
+
+        try:
+            messages, message_obj, tool_results = await self._run_tools(message)
 
             if message_obj.tool_calls:
-                # Execute requested tools
-                for tool_call in message_obj.tool_calls:
-                    tool_name = tool_call.function.name
-                    tool_args = json.loads(tool_call.function.arguments)
-
-                    # Execute tool
-                    result = execute_tool(tool_name, tool_args)
-                    tool_results[tool_name] = result
-
-                    # Add tool result to conversation
-                    messages.append({
-                        "role": "assistant",
-                        "content": None,
-                        "tool_calls": [tool_call.model_dump()]
-                    })
-                    messages.append({
-                        "role": "tool",
-                        "tool_call_id": tool_call.id,
-                        "content": json.dumps(result)
-                    })
-
-                # Get final synthesis from agent
-                final_response = self.client.chat.completions.create(
+                stream = await self._create(
+                    "synthesis",
                     model=self.model,
                     messages=messages,
                     temperature=AGENT_TEMPERATURE,
-                    max_tokens=AGENT_MAX_TOKENS
+                    max_tokens=AGENT_MAX_TOKENS,
+                    stream=True
                 )
 
-                synthesis = final_response.choices[0].message.content
+                parts = []
+                async for chunk in self._stream_chunks("synthesis", stream):
+                    if not chunk.choices:
+                        continue
+                    delta = chunk.choices[0].delta.content
+                    if not delta:
+                        continue
+
+                    parts.append(delta)
+                    if partial_file:
+                        partial_file.write(delta)
+                        partial_file.flush()
+                    yield {"type": "delta", "content": delta}
+
+                synthesis = "".join(parts)
             else:
-                # No tools called, use direct response
-                synthesis = message_obj.content
-                tool_results = {}
+                # No tools called, the direct response is the whole synthesis
+                synthesis = message_obj.content or ""
+                yield {"type": "delta", "content": synthesis}
 
-            # Structure the output
-            return self._structure_output(
+            output = self._structure_output(
                 message=message,
                 sender=sender,
                 tool_results=tool_results,
@@ -127,18 +317,466 @@ class FTEAgent:
             )
 
         except Exception as e:
-            return {
+            output = {
                 "error": str(e),
                 "message": message,
                 "sender": sender
             }
 
+        finally:
+            # The partial file only mirrors an in-flight stream
+            if partial_file:
+                partial_file.close()
+                partial_path.unlink(missing_ok=True)
+
+        yield {"type": "result", "output": output}
+
+    async def _run_tools(self, message: str) -> Tuple[List[Dict], object, Dict]:
+        """
+        Initial agent call plus execution of any requested tools
+
+        Args:
+            message: The message content to analyze
+
+        Returns:
+            (conversation including tool results, first response message,
+            tool results keyed by tool name)
+        """
+        # Initial agent call with tools
+        messages = self._analysis_messages(message)
+
+        # Agent reasoning loop
+        response = await self._create(
+            "initial",
+            model=self.model,
+            messages=messages,
+            tools=self._select_relevant_tools(message),
+            tool_choice="auto",
+            parallel_tool_calls=True,
+            temperature=AGENT_TEMPERATURE,
+            max_tokens=AGENT_MAX_TOKENS
+        )
+
+        # Process tool calls
+        tool_results = {}
+        message_obj = response.choices[0].message
+
+        if message_obj.tool_calls:
+            tool_calls = message_obj.tool_calls
+
+            # Execute requested tools concurrently - skills are independent
+            # functions of the same content, so the tool phase costs
+            # max(tool) instead of sum(tool)
+            results = await asyncio.gather(*[
+                self._execute_tool(
+                    tool_call.function.name,
+                    orjson.loads(tool_call.function.arguments)
+                )
+                for tool_call in tool_calls
+            ])
+
+            # Add tool results to conversation in the original call order
+            for tool_call, result in zip(tool_calls, results):
+                tool_results[tool_call.function.name] = result
+
+                messages.append({
+                    "role": "assistant",
+                    "content": None,
+                    "tool_calls": [tool_call.model_dump()]
+                })
+                messages.append({
+                    "role": "tool",
+                    "tool_call_id": tool_call.id,
+                    "content": orjson.dumps(bound_tool_result(result)).decode()
+                })
+
+        return messages, message_obj, tool_results
+
+    async def _create(self, stage: str, **kwargs):
+        """
+        Chat completion bounded by AGENT_TIMEOUT
+
+        Args:
+            stage: Stage name reported if the call times out
+            **kwargs: Arguments for chat.completions.create
+
+        Returns:
+            Completion response (or stream)
+        """
+        try:
+            async with asyncio.timeout(AGENT_TIMEOUT):
+                return await self.client.chat.completions.create(**kwargs)
+        except TimeoutError:
+            raise TimeoutError(f"{stage} LLM call timed out after {AGENT_TIMEOUT}s") from None
+
+    async def _stream_chunks(self, stage: str, stream) -> AsyncIterator:
+        """
+        Iterate a completion stream, bounding each read by AGENT_TIMEOUT
+
+        _create only bounds opening the stream; this bounds reading it, so a
+        stalled stream fails instead of hanging. Timing each read, rather than
+        wrapping the whole loop, keeps the consumer's time between chunks out
+        of the budget (and out of reach of the cancellation).
+
+        Args:
+            stage: Stage name reported if the stream stalls
+            stream: Stream returned by _create(..., stream=True)
+
+        Yields:
+            Stream chunks
+        """
+        chunks = stream.__aiter__()
+        try:
+            while True:
+                try:
+                    async with asyncio.timeout(AGENT_TIMEOUT):
+                        chunk = await chunks.__anext__()
+                except StopAsyncIteration:
+                    return
+                except TimeoutError:
+                    raise TimeoutError(
+                        f"{stage} LLM stream stalled for {AGENT_TIMEOUT}s"
+                    ) from None
+                yield chunk
+        finally:
+            # Release the HTTP response, including when the stream stalled
+            await stream.close()
+
+    async def _execute_tool(self, name: str, arguments: Dict) -> Dict:
+        """
+        Run a tool in a worker thread, bounded by its timeout
+
+        A slow tool records a timeout result instead of holding up the others.
+
+        Args:
+            name: Tool name
+            arguments: Tool arguments
+
+        Returns:
+            Tool result, or {"error": "timeout", "stage": name}
+        """
+        try:
+            async with asyncio.timeout(TOOL_TIMEOUTS.get(name, TOOL_TIMEOUT)):
+                return await asyncio.to_thread(execute_tool, name, arguments)
+        except TimeoutError:
+            return {"error": "timeout", "stage": name}
+
+    def _select_relevant_tools(self, message: str) -> List[Dict]:
+        """
+        Pre-route a message to the tools worth offering the model
+
+        Cheap local heuristics drop tools whose output would be empty anyway,
+        so acknowledgements and autoreplies don't pay for a summary or task
+        extraction. Anything ambiguous keeps the full tool set.
+
+        Args:
+            message: The message content to analyze
+
+        Returns:
+            Subset of tool definitions to pass to the model
+        """
+        is_action = bool(_ACTION_RE.search(message))
+        is_question = "?" in message
+
+        keep = set(TOOLS)
+        if not is_action:
+            keep.discard("task_extractor")
+            # Requests and imperatives want a reply even without a question mark
+            if not is_question:
+                keep.discard("reply_suggester")
+        # Only short messages with no request or question lose the summary
+        if not is_action and not is_question and len(message.split()) < SHORT_MESSAGE_WORDS:
+            keep.discard("summarizer")
+
+        tools = [tool for tool in self.tools if tool["function"]["name"] in keep]
+        return tools or self.tools
+
+    async def analyze_many(self, messages: List[str], senders: List[str] = None) -> List[Dict]:
+        """
+        Analyze many messages concurrently
+
+        Args:
+            messages: Message contents to analyze
+            senders: Optional sender names, aligned with messages
+
+        Returns:
+            List of structured analysis results, in input order
+        """
+        senders = senders or [None] * len(messages)
+
+        async with asyncio.TaskGroup() as group:
+            tasks = [
+                group.create_task(self.analyze_message(message, sender))
+                for message, sender in zip(messages, senders)
+            ]
+
+        return [task.result() for task in tasks]
+
+    async def batch_analyze(self, messages: List[str], senders: List[str] = None) -> List[Dict]:
+        """
+        Analyze accumulated messages through the Batch API
+
+        Meant for background inbox sweeps, not interactive use: results arrive
+        within the completion window at batch pricing. Tools run locally up
+        front, so each message needs a single synthesis request. OpenRouter
+        has no Batch API, so requests go to BATCH_BASE_URL, a provider that
+        implements the OpenAI Batch and Files endpoints, using that provider's
+        own BATCH_API_KEY and BATCH_MODEL.
+
+        Args:
+            messages: Message contents to analyze
+            senders: Optional sender names, aligned with messages
+
+        Returns:
+            List of structured analysis results, in input order
+
+        Raises:
+            RuntimeError: If no batch provider is configured
+        """
+        # Never fall back to the OpenRouter key or model: neither belongs to
+        # the batch provider
+        missing = [
+            name for name, value in (
+                ("BATCH_BASE_URL", BATCH_BASE_URL),
+                ("BATCH_API_KEY", BATCH_API_KEY),
+                ("BATCH_MODEL", BATCH_MODEL)
+            )
+            if not value
+        ]
+        if missing:
+            raise RuntimeError(
+                f"Batch analysis needs {', '.join(missing)} set for a provider "
+                "with the OpenAI Batch API; OpenRouter does not support it"
+            )
+
+        senders = senders or [None] * len(messages)
+
+        # Run every tool locally and build one request per message
+        all_tool_results = []
+        lines = []  # JSONL request lines, as bytes
+        for i, message in enumerate(messages):
+            tool_results = await asyncio.to_thread(self._run_all_tools, message)
+            all_tool_results.append(tool_results)
+
+            lines.append(orjson.dumps({
+                "custom_id": f"msg-{i}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": BATCH_MODEL,
+                    "messages": self._batch_messages(message, tool_results),
+                    "temperature": AGENT_TEMPERATURE,
+                    "max_tokens": AGENT_MAX_TOKENS
+                }
+            }))
+
+        batch_client = AsyncOpenAI(
+            base_url=BATCH_BASE_URL,
+            api_key=BATCH_API_KEY,
+            timeout=AGENT_TIMEOUT
+        )
+        try:
+            # Upload requests and start the batch
+            batch_file = await batch_client.files.create(
+                file=("batch.jsonl", b"\n".join(lines)),
+                purpose="batch"
+            )
+            batch = await batch_client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window=BATCH_COMPLETION_WINDOW
+            )
+
+            # Poll with exponential backoff until the batch finishes
+            delay = BATCH_POLL_INTERVAL
+            while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, BATCH_MAX_POLL_INTERVAL)
+                batch = await batch_client.batches.retrieve(batch.id)
+
+            if batch.status != "completed" or not batch.output_file_id:
+                raise RuntimeError(f"Batch {batch.id} ended with status: {batch.status}")
+
+            # Collect synthesis text per message
+            output_file = await batch_client.files.content(batch.output_file_id)
+            syntheses = {}
+            for line in output_file.text.splitlines():
+                if not line.strip():
+                    continue
+                record = orjson.loads(line)
+                response = record.get("response") or {}
+                if response.get("status_code") == 200:
+                    body = response["body"]
+                    syntheses[record["custom_id"]] = body["choices"][0]["message"]["content"]
+
+        except Exception as e:
+            return [
+                {"error": str(e), "message": message, "sender": sender}
+                for message, sender in zip(messages, senders)
+            ]
+
+        finally:
+            await batch_client.close()
+
+        results = []
+        for i, (message, sender) in enumerate(zip(messages, senders)):
+            custom_id = f"msg-{i}"
+            if custom_id not in syntheses:
+                results.append({
+                    "error": "No batch result for message",
+                    "message": message,
+                    "sender": sender
+                })
+                continue
+
+            results.append(self._structure_output(
+                message=message,
+                sender=sender,
+                tool_results=all_tool_results[i],
+                synthesis=syntheses[custom_id]
+            ))
+
+        return results
+
+    def _run_all_tools(self, message: str) -> Dict:
+        """Run every registered tool on a message"""
+        return {name: execute_tool(name, {"content": message}) for name in TOOLS}
+
+    def _analysis_messages(self, message: str) -> List[Dict]:
+        """
+        Build the opening conversation for analyzing a message
+
+        Static text (system prompt, analysis instructions) comes first and is
+        marked with cache_control, so providers can bill the shared prefix at
+        the prompt-cache rate; the message itself goes last.
+
+        Args:
+            message: The message content to analyze
+
+        Returns:
+            System and user chat messages
+        """
+        return [
+            {
+                "role": "system",
+                "content": [
+                    {
+                        "type": "text",
+                        "text": SYSTEM_PROMPT,
+                        "cache_control": {"type": "ephemeral"}
+                    }
+                ]
+            },
+            {
+                "role": "user",
+                "content": [
+                    {
+                        "type": "text",
+                        "text": ANALYSIS_PROMPT_PREFIX,
+                        "cache_control": {"type": "ephemeral"}
+                    },
+                    {"type": "text", "text": message}
+                ]
+            }
+        ]
+
+    def _batch_messages(self, message: str, tool_results: Dict) -> List[Dict]:
+        """
+        Build a synthesis conversation from locally executed tool results
+
+        Content stays plain strings: cache_control parts are an OpenRouter /
+        Anthropic extension that Batch API providers reject.
+
+        Args:
+            message: Original message
+            tool_results: Results keyed by tool name
+
+        Returns:
+            Chat messages ending with the tool outputs
+        """
+        messages = [
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": f"{ANALYSIS_PROMPT_PREFIX}{message}"}
+        ]
+        messages.append(
+            {
+                "role": "assistant",
+                "content": None,
+                "tool_calls": [
+                    {
+                        "id": f"call_{name}",
+                        "type": "function",
+                        "function": {
+                            "name": name,
+                            "arguments": orjson.dumps({"content": message}).decode()
+                        }
+                    }
+                    for name in tool_results
+                ]
+            }
+        )
+
+        for name, result in tool_results.items():
+            messages.append({
+                "role": "tool",
+                "tool_call_id": f"call_{name}",
+                "content": orjson.dumps(bound_tool_result(result)).decode()
+            })
+
+        return messages
+
+    def _from_cache(self, cached: Dict, message: str, sender: Optional[str]) -> Dict:
+        """Adapt a cached analysis to the current message and sender"""
+        cached["message"] = message
+        cached["sender"] = sender or "Unknown"
+        cached["actions"] = self._determine_actions(cached)
+        return cached
+
+    def _parse_analysis(
+        self,
+        content: Optional[str],
+        message: str,
+        sender: Optional[str],
+        tool_results: Dict
+    ) -> Dict:
+        """
+        Build output from a structured (JSON schema) synthesis
+
+        Args:
+            content: Model response, expected to match Analysis
+            message: Original message
+            sender: Message sender
+            tool_results: Results from tool calls (fallback if content is invalid)
+
+        Returns:
+            Structured output dict
+        """
+        try:
+            analysis = Analysis.model_validate_json(content or "")
+        except ValidationError:
+            # Provider ignored the schema - stitch tool results instead
+            return self._structure_output(
+                message=message,
+                sender=sender,
+                tool_results=tool_results,
+                synthesis=content
+            )
+
+        output = {
+            "message": message,
+            "sender": sender or "Unknown",
+            **analysis.model_dump(),
+            "actions": []
+        }
+        output["actions"] = self._determine_actions(output)
+        return output
+
     def _structure_output(
         self,
         message: str,
         sender: Optional[str],
         tool_results: Dict,
-        synthesis: str
+        synthesis: Optional[str]
     ) -> Dict:
         """
         Structure agent output into clean format
@@ -147,7 +785,7 @@ class FTEAgent:
             message: Original message
             sender: Message sender
             tool_results: Results from tool calls
-            synthesis: Agent's final synthesis
+            synthesis: Agent's final synthesis (None to build one from tool results)
 
         Returns:
             Structured output dict
@@ -187,6 +825,13 @@ class FTEAgent:
             task_data = tool_results["task_extractor"]
             output["tasks"] = task_data.get("tasks", [])
 
+        # Without a synthesis call, summarize the tool results
+        if synthesis is None:
+            output["analysis"] = (
+                f"{output['priority']} priority {output['category']} message."
+                + (f" {output['summary']}" if output["summary"] else "")
+            )
+
         # Determine recommended actions
         output["actions"] = self._determine_actions(output)
 
@@ -215,21 +860,21 @@ class FTEAgent:
                 }
             })
 
-        # Create tasks if we found any
+        # Create tasks if we found any (task dicts from either path share a title)
         if analysis.get("tasks"):
             for task in analysis["tasks"]:
                 actions.append({
                     "type": "create_task",
-                    "description": f"Create task: {task}",
+                    "description": f"Create task: {task['title']}",
                     "data": {
-                        "task": task,
+                        "task": task["title"],
                         "priority": analysis["priority"]
                     }
                 })
 
         return actions
 
-    def quick_analyze(self, message: str) -> str:
+    async def quick_analyze(self, message: str) -> str:
         """
         Quick analysis without tool calling (faster, simpler)
 
@@ -240,7 +885,8 @@ class FTEAgent:
             Simple text analysis
         """
         try:
-            response = self.client.chat.completions.create(
+            response = await self._create(
+                "quick",
                 model=self.model,
                 messages=[
                     {"role": "system", "content": SYSTEM_PROMPT},
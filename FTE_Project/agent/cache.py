@@ -0,0 +1,230 @@
+"""
+Response caches for FTE Agent
+Lets repeated and near-duplicate inbox messages reuse a previous analysis
+instead of paying for another round of LLM calls
+"""
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+# Semantic cache needs a local embedding model and an ANN index
+try:
+    import faiss
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+    SEMANTIC_CACHE_AVAILABLE = True
+except ImportError:
+    SEMANTIC_CACHE_AVAILABLE = False
+
+
+class ExactCache:
+    """
+    Exact-match response cache
+    Byte-identical messages (automated notifications, repeated pings) map to
+    the same SHA-256 key and reuse the stored analysis
+    """
+
+    def __init__(self, db_path: Path, ttl_seconds: float = 86400):
+        """
+        Initialize the cache, creating its SQLite table if needed
+
+        Args:
+            db_path: SQLite database file
+            ttl_seconds: Age after which a cached output is ignored
+        """
+        db_path = Path(db_path)
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS exact_cache ("
+            "key TEXT PRIMARY KEY, output TEXT NOT NULL, created_at REAL NOT NULL)"
+        )
+        self.conn.commit()
+
+    @staticmethod
+    def key(message: str) -> str:
+        """Cache key for a message"""
+        return hashlib.sha256(message.encode("utf-8")).hexdigest()
+
+    def lookup(self, message: str) -> Optional[Dict]:
+        """
+        Find the cached analysis for an identical message
+
+        Args:
+            message: Message content
+
+        Returns:
+            Cached output, or None on a miss
+        """
+        row = self.conn.execute(
+            "SELECT output, created_at FROM exact_cache WHERE key = ?",
+            (self.key(message),)
+        ).fetchone()
+
+        if row is None:
+            return None
+
+        output, created_at = row
+        if time.time() - created_at > self.ttl_seconds:
+            return None
+
+        return json.loads(output)
+
+    def store(self, message: str, output: Dict):
+        """
+        Cache the analysis of a message
+
+        Args:
+            message: Message content
+            output: Structured analysis to return on future hits
+        """
+        self.conn.execute(
+            "INSERT OR REPLACE INTO exact_cache (key, output, created_at) VALUES (?, ?, ?)",
+            (self.key(message), json.dumps(output), time.time())
+        )
+        self.conn.commit()
+
+
+class SemanticCache:
+    """
+    Semantic response cache
+    Embeds each message locally and returns the stored analysis of the
+    closest cached message when their cosine similarity clears a threshold.
+    Vectors live in a FAISS HNSW index (L2-normalized, FP16, inner product);
+    outputs live in a SQLite sidecar keyed by FAISS id. Safe to call from
+    worker threads: one lock serializes index and sidecar access.
+    """
+
+    INDEX_FILE = "cache.faiss"
+    PAYLOAD_FILE = "semantic_cache.db"
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        model_name: str,
+        threshold: float = 0.92,
+        ttl_seconds: float = 86400,
+        hnsw_m: int = 32,
+        search_k: int = 4
+    ):
+        """
+        Initialize the cache, reloading any index persisted in cache_dir
+
+        Args:
+            cache_dir: Directory holding the index and cached outputs
+            model_name: sentence-transformers model used for embeddings
+            threshold: Minimum cosine similarity for a cache hit
+            ttl_seconds: Age after which a cached output is ignored
+            hnsw_m: HNSW graph degree
+            search_k: Neighbours checked per lookup (skips expired entries)
+        """
+        if not SEMANTIC_CACHE_AVAILABLE:
+            raise ImportError(
+                "Semantic cache requires sentence-transformers and faiss: "
+                "pip install sentence-transformers faiss-cpu"
+            )
+
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self.search_k = search_k
+
+        self.model = SentenceTransformer(model_name)
+        dim = self.model.get_sentence_embedding_dimension()
+
+        self.index_path = self.cache_dir / self.INDEX_FILE
+        if self.index_path.exists():
+            self.index = faiss.read_index(str(self.index_path))
+        else:
+            self.index = faiss.IndexHNSWSQ(
+                dim,
+                faiss.ScalarQuantizer.QT_fp16,
+                hnsw_m,
+                faiss.METRIC_INNER_PRODUCT
+            )
+
+        # store() runs in a worker thread; the lock guards the connection and
+        # FAISS index, neither of which is safe for concurrent use
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(
+            self.cache_dir / self.PAYLOAD_FILE,
+            check_same_thread=False
+        )
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS semantic_cache ("
+            "id INTEGER PRIMARY KEY, output TEXT NOT NULL, created_at REAL NOT NULL)"
+        )
+        self.conn.commit()
+
+    def embed(self, message: str):
+        """Compute the L2-normalized embedding used for lookup and storage"""
+        embedding = np.asarray(self.model.encode([message]), dtype="float32")
+        faiss.normalize_L2(embedding)
+        return embedding
+
+    def lookup(self, embedding) -> Optional[Dict]:
+        """
+        Find a cached analysis for a message embedding
+
+        Args:
+            embedding: Embedding from embed()
+
+        Returns:
+            Cached output, or None on a miss
+        """
+        with self.lock:
+            if self.index.ntotal == 0:
+                return None
+
+            similarities, ids = self.index.search(embedding, self.search_k)
+            now = time.time()
+
+            for similarity, entry_id in zip(similarities[0], ids[0]):
+                # Results are sorted by similarity
+                if entry_id < 0 or similarity < self.threshold:
+                    return None
+
+                row = self.conn.execute(
+                    "SELECT output, created_at FROM semantic_cache WHERE id = ?",
+                    (int(entry_id),)
+                ).fetchone()
+                if row is None:
+                    continue
+
+                output, created_at = row
+                if now - created_at > self.ttl_seconds:
+                    # HNSW can't remove vectors; dropping the payload expires them
+                    self.conn.execute("DELETE FROM semantic_cache WHERE id = ?", (int(entry_id),))
+                    self.conn.commit()
+                    continue
+
+                return json.loads(output)
+
+            return None
+
+    def store(self, embedding, output: Dict):
+        """
+        Add an analysis to the cache and persist it
+
+        Args:
+            embedding: Embedding from embed()
+            output: Structured analysis to return on future hits
+        """
+        with self.lock:
+            # HNSW indexes assign sequential ids
+            entry_id = self.index.ntotal
+            self.index.add(embedding)
+
+            self.conn.execute(
+                "INSERT OR REPLACE INTO semantic_cache (id, output, created_at) VALUES (?, ?, ?)",
+                (entry_id, json.dumps(output), time.time())
+            )
+            self.conn.commit()
+            faiss.write_index(self.index, str(self.index_path))
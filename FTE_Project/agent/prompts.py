@@ -33,10 +33,9 @@ Provide a structured analysis with:
 - Recommended actions
 """
 
-ANALYSIS_PROMPT = """Analyze this message and provide a comprehensive assessment:
-
-Message:
-{message}
+# Static instructions come first and the message last, so every request
+# shares a byte-identical prefix that providers can cache
+ANALYSIS_PROMPT_PREFIX = """Analyze the message below and provide a comprehensive assessment.
 
 Use the available tools to:
 1. Summarize the key points
@@ -46,8 +45,12 @@ Use the available tools to:
 5. Extract any actionable tasks
 
 Provide a structured response that helps the user quickly understand and act on this message.
+
+Message:
 """
 
+ANALYSIS_PROMPT = ANALYSIS_PROMPT_PREFIX + "{message}"
+
 TOOL_SELECTION_PROMPT = """Based on this message, which tools should be used?
 
 Message: {message}
@@ -0,0 +1,41 @@
+"""
+Structured output schema for FTE Agent
+The synthesis call returns JSON matching this model instead of free text
+"""
+from typing import List, Literal, Optional
+
+from pydantic import BaseModel, ConfigDict
+
+
+class Task(BaseModel):
+    """An actionable item, shaped like the task extractor's structured tasks"""
+
+    model_config = ConfigDict(extra="forbid")
+
+    title: str
+    description: str
+    priority: Literal["urgent", "high", "normal"]
+
+
+class Analysis(BaseModel):
+    """Fields the model fills in; message, sender and actions are set in code"""
+
+    model_config = ConfigDict(extra="forbid")
+
+    analysis: str
+    summary: Optional[str]
+    priority: Literal["HIGH", "MEDIUM", "LOW"]
+    category: Literal["work", "personal", "study", "finance", "other"]
+    suggested_reply: Optional[str]
+    tasks: List[Task]
+
+
+# response_format for chat.completions.create, built once at import
+ANALYSIS_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "analysis",
+        "schema": Analysis.model_json_schema(),
+        "strict": True
+    }
+}
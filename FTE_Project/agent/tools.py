@@ -2,19 +2,54 @@
 Tool definitions for FTE Agent
 Skills are registered as tools that the agent can invoke
 """
-import sys
-from pathlib import Path
+import copy
+import functools
+import hashlib
+import threading
+from collections import OrderedDict
 
-# Add skills directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "skills"))
+from config import MAX_TOOL_CHARS, MAX_TOOL_ITEMS
 
-from summarizer import summarize_content
-from reply_suggester import suggest_reply
-from task_extractor import extract_tasks
-from priority_detector import detect_priority
-from categorizer import categorize_content
+# Memoized tool results kept per process
+TOOL_MEMO_SIZE = 1024
 
 
+def _memo(func):
+    """
+    Memoize a pure tool on (tool name, sha1(content), other arguments)
+
+    Retries and replays of the same text reuse the earlier result instead
+    of re-running the skill. Least recently used entries are evicted.
+    Callers get their own deep copy, so mutating a result (as output
+    structuring does) can't corrupt later hits.
+    """
+    cache = OrderedDict()
+    lock = threading.Lock()
+
+    @functools.wraps(func)
+    def wrapper(content: str, **kwargs) -> dict:
+        key = (
+            func.__name__,
+            hashlib.sha1(content.encode("utf-8")).digest(),
+            tuple(sorted(kwargs.items()))
+        )
+        with lock:
+            if key in cache:
+                cache.move_to_end(key)
+                return copy.deepcopy(cache[key])
+
+        result = func(content, **kwargs)
+
+        with lock:
+            cache[key] = copy.deepcopy(result)
+            if len(cache) > TOOL_MEMO_SIZE:
+                cache.popitem(last=False)
+        return result
+
+    return wrapper
+
+
+@_memo
 def summarizer_tool(content: str) -> dict:
     """
     Summarize message content
@@ -25,9 +60,12 @@ def summarizer_tool(content: str) -> dict:
     Returns:
         dict with summary, key_points, keywords
     """
+    from skills.summarizer import summarize_content
+
     return summarize_content(content, return_structured=True)
 
 
+@_memo
 def reply_suggester_tool(content: str, sender: str = None) -> dict:
     """
     Suggest appropriate replies to a message
@@ -39,9 +77,12 @@ def reply_suggester_tool(content: str, sender: str = None) -> dict:
     Returns:
         dict with message_type and suggestions list
     """
+    from skills.reply_suggester import suggest_reply
+
     return suggest_reply(content, sender, return_structured=True)
 
 
+@_memo
 def task_extractor_tool(content: str) -> dict:
     """
     Extract actionable tasks from message
@@ -52,9 +93,12 @@ def task_extractor_tool(content: str) -> dict:
     Returns:
         dict with tasks list
     """
+    from skills.task_extractor import extract_tasks
+
     return extract_tasks(content, return_structured=True)
 
 
+@_memo
 def priority_detector_tool(content: str) -> dict:
     """
     Detect priority level of message
@@ -65,9 +109,12 @@ def priority_detector_tool(content: str) -> dict:
     Returns:
         dict with priority, confidence, reasoning
     """
+    from skills.priority_detector import detect_priority
+
     return detect_priority(content, return_structured=True)
 
 
+@_memo
 def categorizer_tool(content: str) -> dict:
     """
     Categorize message type
@@ -78,6 +125,8 @@ def categorizer_tool(content: str) -> dict:
     Returns:
         dict with category, confidence, reasoning
     """
+    from skills.categorizer import categorize_content
+
     return categorize_content(content, return_structured=True)
 
 
@@ -160,29 +209,83 @@ TOOLS = {
 }
 
 
+# OpenAI-compatible tool definitions, built once at import
+TOOL_DEFINITIONS = [
+    {
+        "type": "function",
+        "function": {
+            "name": name,
+            "description": spec["description"],
+            "parameters": spec["parameters"]
+        }
+    }
+    for name, spec in TOOLS.items()
+]
+
+# Tool name -> function, flattened for dispatch
+_TOOL_FUNCS = {name: spec["function"] for name, spec in TOOLS.items()}
+
+
 def get_tool_definitions():
     """Get OpenAI-compatible tool definitions"""
-    tools = []
-    for name, spec in TOOLS.items():
-        tools.append({
-            "type": "function",
-            "function": {
-                "name": name,
-                "description": spec["description"],
-                "parameters": spec["parameters"]
-            }
-        })
-    return tools
+    return TOOL_DEFINITIONS
+
+
+def _bound_output(value):
+    """
+    Trim long strings and lists in a tool result
+
+    Args:
+        value: Tool result (or part of one)
+
+    Returns:
+        tuple: (bounded value, whether anything was trimmed)
+    """
+    if isinstance(value, str):
+        if len(value) > MAX_TOOL_CHARS:
+            return value[:MAX_TOOL_CHARS], True
+        return value, False
+
+    if isinstance(value, list):
+        truncated = len(value) > MAX_TOOL_ITEMS
+        items = []
+        for item in value[:MAX_TOOL_ITEMS]:
+            item, item_truncated = _bound_output(item)
+            truncated = truncated or item_truncated
+            items.append(item)
+        return items, truncated
+
+    if isinstance(value, dict):
+        truncated = False
+        bounded = {}
+        for key, item in value.items():
+            bounded[key], item_truncated = _bound_output(item)
+            truncated = truncated or item_truncated
+        return bounded, truncated
+
+    return value, False
+
+
+def bound_tool_result(result: dict) -> dict:
+    """
+    Copy of a tool result trimmed for the model conversation
+
+    Keeps verbose skill output from inflating the synthesis prompt; the
+    untrimmed result is what callers get back.
+    """
+    bounded, truncated = _bound_output(result)
+    if truncated:
+        bounded["_truncated"] = True
+    return bounded
 
 
 def execute_tool(tool_name: str, arguments: dict) -> dict:
     """Execute a tool by name with given arguments"""
-    if tool_name not in TOOLS:
+    tool_func = _TOOL_FUNCS.get(tool_name)
+    if not tool_func:
         return {"error": f"Unknown tool: {tool_name}"}
 
     try:
-        tool_func = TOOLS[tool_name]["function"]
-        result = tool_func(**arguments)
-        return result
+        return tool_func(**arguments)
     except Exception as e:
         return {"error": str(e)}
@@ -2,6 +2,8 @@
 from .settings import *
 
 __all__ = [
+    'Settings',
+    'get_settings',
     'OPENROUTER_API_KEY',
     'OPENROUTER_MODEL',
     'OPENROUTER_BASE_URL',
@@ -9,5 +11,7 @@ __all__ = [
     'VAULT_PROCESSED',
     'VAULT_ACTIONS',
     'VAULT_LOGS',
+    'VAULT_FAILED',
+    'ensure_vault_dirs',
     'validate_config'
 ]
@@ -2,49 +2,136 @@
 Centralized configuration management for FTE Agent
 """
 import os
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Environment-derived settings, parsed once per process"""
+    openrouter_api_key: str
+    openrouter_model: str
+    app_name: str
+    log_level: str
+    semantic_cache_enabled: bool
+    exact_cache_enabled: bool
+    batch_base_url: str
+    batch_api_key: str
+    batch_model: str
+    skill_executor: str
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Load environment variables and return the shared Settings"""
+    load_dotenv()
+    return Settings(
+        openrouter_api_key=os.getenv("OPENROUTER_API_KEY", ""),
+        openrouter_model=os.getenv("OPENROUTER_MODEL", "meta-llama/llama-3.1-8b-instruct:free"),
+        app_name=os.getenv("APP_NAME", "FTE_Agent"),
+        log_level=os.getenv("LOG_LEVEL", "INFO"),
+        semantic_cache_enabled=os.getenv("SEMANTIC_CACHE_ENABLED", "false").lower() == "true",
+        exact_cache_enabled=os.getenv("EXACT_CACHE_ENABLED", "false").lower() == "true",
+        batch_base_url=os.getenv("BATCH_BASE_URL", ""),
+        batch_api_key=os.getenv("BATCH_API_KEY", ""),
+        batch_model=os.getenv("BATCH_MODEL", ""),
+        skill_executor=os.getenv("SKILL_EXECUTOR", "thread").lower()
+    )
+
 
 # Base paths
 BASE_DIR = Path(__file__).parent.parent
 VAULT_DIR = BASE_DIR / "vault"
 
 # OpenRouter Configuration
-OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY", "")
-OPENROUTER_MODEL = os.getenv("OPENROUTER_MODEL", "meta-llama/llama-3.1-8b-instruct:free")
+OPENROUTER_API_KEY = get_settings().openrouter_api_key
+OPENROUTER_MODEL = get_settings().openrouter_model
 OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
 
 # Application Settings
-APP_NAME = os.getenv("APP_NAME", "FTE_Agent")
-LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+APP_NAME = get_settings().app_name
+LOG_LEVEL = get_settings().log_level
 
 # Vault Paths
 VAULT_INBOX = VAULT_DIR / "inbox"
 VAULT_PROCESSED = VAULT_DIR / "processed"
 VAULT_ACTIONS = VAULT_DIR / "actions"
 VAULT_LOGS = VAULT_DIR / "logs"
+VAULT_FAILED = VAULT_DIR / "failed"  # Inbox files that couldn't be read or moved
+
+# Vault directories are created on first use, not at import
+_VAULT_READY = False
+
+
+def ensure_vault_dirs():
+    """Create the vault directories once per process"""
+    global _VAULT_READY
+    if _VAULT_READY:
+        return
+
+    for path in [VAULT_INBOX, VAULT_PROCESSED, VAULT_ACTIONS, VAULT_LOGS, VAULT_FAILED]:
+        path.mkdir(parents=True, exist_ok=True)
+    _VAULT_READY = True
 
-# Ensure directories exist
-for path in [VAULT_INBOX, VAULT_PROCESSED, VAULT_ACTIONS, VAULT_LOGS]:
-    path.mkdir(parents=True, exist_ok=True)
 
 # Agent Configuration
 AGENT_TEMPERATURE = 0.7
 AGENT_MAX_TOKENS = 2000
-AGENT_TIMEOUT = 60  # seconds
+AGENT_TIMEOUT = 60  # seconds, per LLM call
+TOOL_TIMEOUT = 10  # seconds, per tool
+TOOL_TIMEOUTS = {}  # Per-tool overrides, e.g. {"summarizer": 30}
+HTTP_MAX_CONNECTIONS = 100  # Shared OpenRouter connection pool
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 20
+SKIP_SYNTHESIS = True  # Build output from tool results instead of a second LLM call
+MAX_TOOL_CHARS = 2000  # Longest string kept in a tool result
+MAX_TOOL_ITEMS = 20  # Longest list kept in a tool result
+
+# Batch API Configuration (offline inbox sweeps)
+# OpenRouter has no Batch/Files endpoints, so batches go to a separately
+# configured OpenAI-compatible provider with its own key and model id;
+# batch_analyze refuses to run unless all three are set
+BATCH_BASE_URL = get_settings().batch_base_url
+BATCH_API_KEY = get_settings().batch_api_key
+BATCH_MODEL = get_settings().batch_model
+BATCH_COMPLETION_WINDOW = "24h"
+BATCH_POLL_INTERVAL = 10  # seconds, doubled after each poll
+BATCH_MAX_POLL_INTERVAL = 300  # seconds
+
+# Response Cache Configuration
+CACHE_DIR = VAULT_DIR / "cache"
+
+# Exact cache is only sound for deterministic generations (temperature 0),
+# unless explicitly enabled
+EXACT_CACHE_ENABLED = get_settings().exact_cache_enabled or AGENT_TEMPERATURE == 0
+EXACT_CACHE_PATH = CACHE_DIR / "exact_cache.db"
+EXACT_CACHE_TTL_HOURS = 24
+
+SEMANTIC_CACHE_ENABLED = get_settings().semantic_cache_enabled
+SEMANTIC_CACHE_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+SEMANTIC_CACHE_THRESHOLD = 0.92
+SEMANTIC_CACHE_TTL_HOURS = 24
+
+# Skill Configuration (analysis without the agent brain)
+SKILL_CACHE_SIZE = 1024  # Messages whose skill results are memoized
+# "thread" (default; skills take well under a millisecond, so process IPC
+# costs more than it saves) or "process" (bypasses the GIL for very large inputs)
+SKILL_EXECUTOR = get_settings().skill_executor
+SKILL_WORKERS = min(5, os.cpu_count() or 1)
 
 # Action Configuration
 ACTION_EXPIRY_HOURS = 24
+LOG_FSYNC_EVERY = 10  # Execution log entries between flush + fsync
+WHATSAPP_QUEUE_SIZE = 256  # Messages buffered between watcher and analysis
 AUTO_APPROVE_LOW_RISK = False
 
 def validate_config():
     """Validate required configuration"""
-    if not OPENROUTER_API_KEY:
+    if not get_settings().openrouter_api_key:
         raise ValueError(
             "OPENROUTER_API_KEY not found. "
             "Please copy .env.example to .env and add your API key."
         )
+    ensure_vault_dirs()
     return True
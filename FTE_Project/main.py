@@ -11,30 +11,150 @@ Usage:
 import os
 import sys
 import time
-import json
+import asyncio
+import functools
+import hashlib
+import queue
 import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
+import orjson
+
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from agent import FTEAgent
+from skills.summarizer import summarize_content
+from skills.priority_detector import detect_priority
+from skills.categorizer import categorize_content, categorize_batch
+from skills.reply_suggester import suggest_reply
+from skills.task_extractor import extract_tasks
 from config import (
     VAULT_INBOX,
     VAULT_PROCESSED,
     VAULT_ACTIONS,
     VAULT_LOGS,
+    VAULT_FAILED,
+    SKILL_CACHE_SIZE,
+    SKILL_EXECUTOR,
+    SKILL_WORKERS,
+    LOG_FSYNC_EVERY,
+    WHATSAPP_QUEUE_SIZE,
+    ensure_vault_dirs,
     validate_config
 )
 
 # Import WhatsApp watcher
 try:
-    from watchers.whatsapp_watcher import whatsapp_watcher
+    from watchers.whatsapp_watcher import whatsapp_watcher, message_filename
     WHATSAPP_AVAILABLE = True
 except ImportError:
     WHATSAPP_AVAILABLE = False
 
+# Import filesystem event observer (optional - falls back to polling)
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+
+INBOX_SUFFIXES = ('.txt', '.md')
+# Without close events, a file this long unwritten is taken as complete
+INBOX_SETTLE_SECONDS = 1.0
+
+# Console banners, built once
+_RULE = "=" * 60
+_SEP_THIN = "-" * 60
+_WELCOME_BANNER = (
+    "\n" + _RULE + "\n"
+    "  FTE AGENT - Personal AI Employee\n"
+    "  Bronze: Observation | Silver: Agent Analysis + Approval\n"
+    + _RULE + "\n"
+)
+_ANALYSIS_BANNER = "\n" + _RULE + "\n  AGENT ANALYSIS\n" + _RULE
+_ANALYSIS_FOOTER = "\n" + _RULE
+_APPROVAL_BANNER = "\n" + _SEP_THIN + "\n  APPROVAL REQUIRED\n" + _SEP_THIN
+_EXECUTING_BANNER = "\n" + _SEP_THIN + "\n  EXECUTING ACTIONS\n" + _SEP_THIN
+
+_CATEGORY_UPPER = {
+    category: category.upper()
+    for category in ("work", "personal", "study", "finance", "other")
+}
+
+# Skill results per (message hash, sender), least recently used first
+_SKILL_CACHE = OrderedDict()
+
+
+if WATCHDOG_AVAILABLE:
+    class InboxEventHandler(FileSystemEventHandler):
+        """
+        Queue message files once their writer is done with them
+
+        A close-after-write event (inotify, Linux) or a rename into the inbox
+        means the file is complete. Where close events don't exist, a file is
+        queued once it has gone INBOX_SETTLE_SECONDS without being written.
+        """
+
+        def __init__(self, inbox_queue: queue.Queue, settle: bool):
+            super().__init__()
+            self.inbox_queue = inbox_queue
+            self.settle = settle
+            # Path -> time of its last create/modify event, until it settles
+            self._unsettled = {}
+            self._lock = threading.Lock()
+
+        def _enqueue(self, path: str):
+            if path.endswith(INBOX_SUFFIXES):
+                with self._lock:
+                    self._unsettled.pop(path, None)
+                self.inbox_queue.put(Path(path))
+
+        def _touch(self, path: str):
+            if self.settle and path.endswith(INBOX_SUFFIXES):
+                with self._lock:
+                    self._unsettled[path] = time.monotonic()
+
+        def on_created(self, event):
+            if not event.is_directory:
+                self._touch(event.src_path)
+
+        def on_modified(self, event):
+            if not event.is_directory:
+                self._touch(event.src_path)
+
+        def on_closed(self, event):
+            # Closed after writing: the content is complete
+            if not event.is_directory:
+                self._enqueue(event.src_path)
+
+        def on_moved(self, event):
+            # Files written elsewhere and renamed into the inbox
+            if not event.is_directory:
+                self._enqueue(event.dest_path)
+
+        def queue_settled(self):
+            """Queue files that haven't been written to for INBOX_SETTLE_SECONDS"""
+            cutoff = time.monotonic() - INBOX_SETTLE_SECONDS
+            with self._lock:
+                settled = [path for path, seen in self._unsettled.items() if seen <= cutoff]
+                for path in settled:
+                    del self._unsettled[path]
+            for path in settled:
+                self.inbox_queue.put(Path(path))
+
+
+def _init_skill_worker():
+    """Load skill modules once per worker process"""
+    import skills.summarizer
+    import skills.priority_detector
+    import skills.categorizer
+    import skills.reply_suggester
+    import skills.task_extractor
+
 
 class FTEOrchestrator:
     """
@@ -48,6 +168,22 @@ class FTEOrchestrator:
             validate_config()
             self.agent = FTEAgent()
             self.running = True
+
+            # Long-lived pool for skill calls
+            if SKILL_EXECUTOR == "process":
+                self.executor = ProcessPoolExecutor(
+                    max_workers=SKILL_WORKERS,
+                    initializer=_init_skill_worker
+                )
+            else:
+                self.executor = ThreadPoolExecutor(max_workers=SKILL_WORKERS)
+
+            # Append-only execution log, kept open for the whole run
+            self._log_fh = open(VAULT_LOGS / "execution.jsonl", 'ab', buffering=1 << 16)
+            self._log_pending = 0
+
+            # Inbox files that failed and couldn't be moved out of the inbox
+            self._failed_files = set()
             print("SUCCESS: FTE Agent initialized")
         except ValueError as e:
             print(f"ERROR: Configuration error - {e}")
@@ -57,36 +193,67 @@ class FTEOrchestrator:
             print("3. Get a free API key at: https://openrouter.ai/keys")
             sys.exit(1)
 
+    def shutdown(self):
+        """Release the skill worker pool and sync the execution log"""
+        self.executor.shutdown(wait=True)
+
+        self._log_fh.flush()
+        os.fsync(self._log_fh.fileno())
+        self._log_fh.close()
+
     def display_banner(self):
         """Display welcome banner"""
-        print("\n" + "=" * 60)
-        print("  FTE AGENT - Personal AI Employee")
-        print("  Bronze: Observation | Silver: Agent Analysis + Approval")
-        print("=" * 60 + "\n")
+        print(_WELCOME_BANNER)
 
-    def analyze_with_skills(self, message: str, sender: str = "Unknown"):
+    async def analyze_with_skills(self, message: str, sender: str = "Unknown", category_result: dict = None):
         """
         Analyze message using skills directly (no agent brain needed)
 
+        The five skills are independent, so they run concurrently on the
+        skill executor and the analysis takes as long as the slowest skill.
+
         Args:
             message: Message content
             sender: Sender name
+            category_result: Precomputed categorizer result (skips the categorizer)
 
         Returns:
             Analysis result dict
         """
-        from skills.summarizer import summarize_content
-        from skills.priority_detector import detect_priority
-        from skills.categorizer import categorize_content
-        from skills.reply_suggester import suggest_reply
-        from skills.task_extractor import extract_tasks
-
-        # Call all skills
-        summary_result = summarize_content(message, return_structured=True)
-        priority_result = detect_priority(message, return_structured=True)
-        category_result = categorize_content(message, return_structured=True)
-        reply_result = suggest_reply(message, sender, return_structured=True)
-        tasks_result = extract_tasks(message, return_structured=True)
+        # Re-analyzed messages reuse their skill results
+        key = (hashlib.blake2b(message.encode('utf-8'), digest_size=16).digest(), sender)
+        skill_results = _SKILL_CACHE.get(key)
+
+        if skill_results is None:
+            # Lowercase once for the skills that accept it; worker processes
+            # lowercase for themselves rather than receive a second copy
+            content_lower = None if SKILL_EXECUTOR == "process" else message.lower()
+
+            # Call all skills
+            loop = asyncio.get_running_loop()
+            calls = [
+                functools.partial(summarize_content, message, return_structured=True),
+                functools.partial(detect_priority, message, return_structured=True, content_lower=content_lower),
+                functools.partial(categorize_content, message, return_structured=True, content_lower=content_lower),
+                functools.partial(suggest_reply, message, sender, return_structured=True),
+                functools.partial(extract_tasks, message, return_structured=True)
+            ]
+            if category_result is not None:
+                del calls[2]
+
+            skill_results = list(await asyncio.gather(*[
+                loop.run_in_executor(self.executor, call) for call in calls
+            ]))
+            if category_result is not None:
+                skill_results.insert(2, category_result)
+            skill_results = tuple(skill_results)
+            _SKILL_CACHE[key] = skill_results
+            if len(_SKILL_CACHE) > SKILL_CACHE_SIZE:
+                _SKILL_CACHE.popitem(last=False)
+        else:
+            _SKILL_CACHE.move_to_end(key)
+
+        summary_result, priority_result, category_result, reply_result, tasks_result = skill_results
 
         # Build result
         result = {
@@ -96,7 +263,7 @@ class FTEOrchestrator:
             'priority': priority_result.get('priority', 'MEDIUM'),
             'category': category_result.get('category', 'other'),
             'suggested_reply': reply_result.get('suggestions', [None])[0] if reply_result.get('suggestions') else None,
-            'tasks': tasks_result.get('tasks', []),
+            'tasks': list(tasks_result.get('tasks', [])),
             'actions': []
         }
 
@@ -117,11 +284,30 @@ class FTEOrchestrator:
             })
 
         return result
-        """Display welcome banner"""
-        print("\n" + "=" * 60)
-        print("  FTE AGENT - Personal AI Employee")
-        print("  Bronze: Observation | Silver: Agent Analysis + Approval")
-        print("=" * 60 + "\n")
+
+    async def analyze_batch(self, messages: list, senders: list = None) -> list:
+        """
+        Analyze many messages, categorizing them in one vectorized pass
+
+        Args:
+            messages: Message contents
+            senders: Sender names, aligned with messages
+
+        Returns:
+            List of analysis result dicts, in input order
+        """
+        senders = senders or ["Unknown"] * len(messages)
+
+        loop = asyncio.get_running_loop()
+        category_results = await loop.run_in_executor(
+            self.executor,
+            functools.partial(categorize_batch, messages, return_structured=True)
+        )
+
+        return await asyncio.gather(*[
+            self.analyze_with_skills(message, sender, category_result)
+            for message, sender, category_result in zip(messages, senders, category_results)
+        ])
 
     def watch_folder(self):
         """
@@ -131,18 +317,64 @@ class FTEOrchestrator:
         print("Place .txt files in vault/inbox/ to process them")
         print("Press Ctrl+C to stop\n")
 
-        processed_files = set()
+        if not WATCHDOG_AVAILABLE:
+            self._poll_folder()
+            return
+
+        # Kernel file events feed a queue; messages are processed on this
+        # thread so the approval prompts stay interactive
+        inbox_queue = queue.Queue()
+        # inotify reports closes; other platforms wait for writes to settle
+        handler = InboxEventHandler(inbox_queue, settle=not sys.platform.startswith("linux"))
+        observer = Observer()
+        observer.schedule(handler, str(VAULT_INBOX), recursive=False)
+        observer.start()
+
+        # Pick up messages that arrived while nothing was watching
+        for file_path in sorted(VAULT_INBOX.iterdir()):
+            if file_path.suffix in INBOX_SUFFIXES:
+                inbox_queue.put(file_path)
 
         try:
             while self.running:
-                # Check for new files
-                inbox_files = list(VAULT_INBOX.glob("*.txt")) + list(VAULT_INBOX.glob("*.md"))
+                handler.queue_settled()
+                try:
+                    file_path = inbox_queue.get(timeout=INBOX_SETTLE_SECONDS)
+                except queue.Empty:
+                    continue
+
+                # Already processed (duplicate event), or failed before
+                if not file_path.exists() or file_path in self._failed_files:
+                    continue
+
+                print(f"\n[BRONZE] New message detected: {file_path.name}")
+                self.process_message_file(file_path)
+
+        except KeyboardInterrupt:
+            print("\n\n[SYSTEM] Stopping watcher...")
+            self.running = False
+
+        finally:
+            observer.stop()
+            observer.join()
+
+    def _poll_folder(self):
+        """Poll the inbox for new messages (used when watchdog is missing)"""
+        try:
+            while self.running:
+                # Check for new files (processed ones have left the inbox);
+                # one directory pass, and scandir caches the file type
+                with os.scandir(VAULT_INBOX) as entries:
+                    inbox_files = [
+                        Path(entry.path) for entry in entries
+                        if entry.name.endswith(INBOX_SUFFIXES) and entry.is_file()
+                    ]
 
                 for file_path in inbox_files:
-                    if file_path not in processed_files:
-                        print(f"\n[BRONZE] New message detected: {file_path.name}")
-                        self.process_message_file(file_path)
-                        processed_files.add(file_path)
+                    if file_path in self._failed_files:
+                        continue
+                    print(f"\n[BRONZE] New message detected: {file_path.name}")
+                    self.process_message_file(file_path)
 
                 time.sleep(2)  # Check every 2 seconds
 
@@ -152,9 +384,9 @@ class FTEOrchestrator:
 
     def watch_whatsapp(self):
         """
-        Start WhatsApp watcher + folder processor
-        WhatsApp watcher saves messages to vault/inbox/
-        Folder watcher processes them with agent
+        Start WhatsApp watcher + message processor
+        The watcher thread hands new messages to an asyncio.Queue and a
+        consumer coroutine analyzes them, with no inbox round-trip
         """
         if not WHATSAPP_AVAILABLE:
             print("ERROR: WhatsApp watcher not available")
@@ -167,15 +399,87 @@ class FTEOrchestrator:
         print("\nWhatsApp will open in browser. Scan QR code to login.")
         print("New messages will be analyzed automatically.\n")
 
-        # Start WhatsApp watcher in background thread
-        whatsapp_thread = threading.Thread(target=whatsapp_watcher, daemon=True)
+        try:
+            asyncio.run(self._whatsapp_pipeline())
+        except KeyboardInterrupt:
+            print("\n\n[SYSTEM] Stopping watcher...")
+            self.running = False
+
+    async def _whatsapp_pipeline(self):
+        """Run the WhatsApp producer thread and consume its messages"""
+        loop = asyncio.get_running_loop()
+        message_queue = asyncio.Queue(maxsize=WHATSAPP_QUEUE_SIZE)
+
+        def on_message(sender, message_text, timestamp):
+            # Called on the watcher thread; blocks while the queue is full
+            asyncio.run_coroutine_threadsafe(
+                message_queue.put((sender, message_text, timestamp)), loop
+            ).result()
+
+        # Playwright's sync API runs in its own thread
+        whatsapp_thread = threading.Thread(
+            target=whatsapp_watcher,
+            kwargs={"on_message": on_message},
+            daemon=True
+        )
         whatsapp_thread.start()
 
-        # Give WhatsApp time to start
-        time.sleep(3)
+        archive_tasks = set()
+        try:
+            while self.running:
+                sender, message_text, timestamp = await message_queue.get()
+                print(f"\n[BRONZE] New WhatsApp message from {sender}")
+
+                # Archive in the background; analysis doesn't wait on disk
+                task = asyncio.create_task(asyncio.to_thread(
+                    self._archive_whatsapp_message, sender, message_text, timestamp
+                ))
+                archive_tasks.add(task)
+                task.add_done_callback(archive_tasks.discard)
+
+                await self._handle_message(message_text, sender)
+        finally:
+            # Ctrl+C cancels this coroutine; let queued archives reach disk first
+            if archive_tasks:
+                await asyncio.wait(archive_tasks)
+
+    def _archive_whatsapp_message(self, sender: str, message_text: str, timestamp: str):
+        """Write a WhatsApp message to vault/processed/ as Markdown"""
+        ensure_vault_dirs()
+        output_path = VAULT_PROCESSED / message_filename(sender, time.time_ns())
+        output_path.write_text(
+            f"# WhatsApp Message\n\n"
+            f"**Source**: WhatsApp\n\n"
+            f"**Sender**: {sender}\n\n"
+            f"**Timestamp**: {timestamp}\n\n"
+            f"**Message**:\n```\n{message_text}\n```\n",
+            encoding='utf-8'
+        )
+
+    async def _handle_message(self, message: str, sender: str):
+        """
+        Analyze a queued message and run the approval flow
 
-        # Start folder watcher to process messages
-        self.watch_folder()
+        Args:
+            message: Message content
+            sender: Sender name
+        """
+        try:
+            print(f"[SILVER] Analyzing message...")
+            result = await self.analyze_with_skills(message, sender)
+            self.display_analysis(result)
+
+            # Approval prompts block on input(), so keep them off the loop
+            if result.get("actions"):
+                approved_actions = await asyncio.to_thread(self.approval_flow, result)
+
+                if approved_actions:
+                    await asyncio.to_thread(self.execute_actions, approved_actions, result)
+
+        except Exception as e:
+            print(f"ERROR: Failed to process message - {e}")
+            import traceback
+            traceback.print_exc()
 
     def process_message_file(self, file_path: Path):
         """
@@ -186,9 +490,17 @@ class FTEOrchestrator:
         """
         try:
             # Read message
-            with open(file_path, 'r', encoding='utf-8') as f:
-                message = f.read()
+            message = file_path.read_text(encoding='utf-8')
+
+            # Move to processed before analysis so the inbox never
+            # surfaces it again (rename is atomic on the same filesystem)
+            processed_path = VAULT_PROCESSED / file_path.name
+            os.rename(file_path, processed_path)
+        except (OSError, UnicodeDecodeError) as e:
+            self._quarantine(file_path, e)
+            return
 
+        try:
             # Extract sender from filename or content
             sender = self.extract_sender(file_path.name, message)
 
@@ -196,7 +508,7 @@ class FTEOrchestrator:
             print(f"[SILVER] Analyzing message...")
 
             # Use skills directly
-            result = self.analyze_with_skills(message, sender)
+            result = asyncio.run(self.analyze_with_skills(message, sender))
 
             # Display results
             self.display_analysis(result)
@@ -208,9 +520,6 @@ class FTEOrchestrator:
                 if approved_actions:
                     self.execute_actions(approved_actions, result)
 
-            # Move to processed
-            processed_path = VAULT_PROCESSED / file_path.name
-            file_path.rename(processed_path)
             print(f"\n[BRONZE] Message moved to processed: {processed_path.name}")
 
         except Exception as e:
@@ -218,6 +527,20 @@ class FTEOrchestrator:
             import traceback
             traceback.print_exc()
 
+    def _quarantine(self, file_path: Path, error: Exception):
+        """
+        Move an unreadable inbox file to vault/failed/ so it isn't retried
+
+        If even that move fails, the file stays put and is skipped for the
+        rest of the run.
+        """
+        print(f"ERROR: Could not process {file_path.name} - {error}")
+        try:
+            os.replace(file_path, VAULT_FAILED / file_path.name)
+            print(f"[BRONZE] Message moved to failed: {file_path.name}")
+        except OSError:
+            self._failed_files.add(file_path)
+
     def extract_sender(self, filename: str, content: str) -> str:
         """Extract sender from filename or content"""
         # Try to extract from filename (e.g., "message_from_john.txt")
@@ -226,8 +549,7 @@ class FTEOrchestrator:
             return sender
 
         # Try to extract from content (look for "From:" line)
-        lines = content.split('\n')
-        for line in lines[:5]:  # Check first 5 lines
+        for line in content.split('\n', 5)[:5]:  # Check first 5 lines
             if line.lower().startswith("from:"):
                 return line.split(":", 1)[1].strip()
 
@@ -240,9 +562,7 @@ class FTEOrchestrator:
         Args:
             result: Analysis result from agent
         """
-        print("\n" + "=" * 60)
-        print("  AGENT ANALYSIS")
-        print("=" * 60)
+        print(_ANALYSIS_BANNER)
 
         # Handle errors
         if "error" in result:
@@ -252,7 +572,8 @@ class FTEOrchestrator:
         # Display key information
         print(f"\n[FROM] {result.get('sender', 'Unknown')}")
         print(f"[PRIORITY] {result.get('priority', 'MEDIUM')}")
-        print(f"[CATEGORY] {result.get('category', 'other').upper()}")
+        category = result.get('category', 'other')
+        print(f"[CATEGORY] {_CATEGORY_UPPER.get(category) or category.upper()}")
 
         # Summary
         if result.get('summary'):
@@ -275,7 +596,7 @@ class FTEOrchestrator:
             print(f"\n[AGENT NOTES]")
             print(f"{result['analysis']}")
 
-        print("\n" + "=" * 60)
+        print(_ANALYSIS_FOOTER)
 
     def approval_flow(self, result: dict) -> list:
         """
@@ -291,9 +612,7 @@ class FTEOrchestrator:
         if not actions:
             return []
 
-        print("\n" + "-" * 60)
-        print("  APPROVAL REQUIRED")
-        print("-" * 60)
+        print(_APPROVAL_BANNER)
 
         approved = []
 
@@ -321,86 +640,70 @@ class FTEOrchestrator:
         """
         Execute approved actions
 
+        All outputs of a run are appended to the day's actions JSONL file
+        through one buffered handle and synced to disk once at the end.
+
         Args:
             actions: List of approved actions
             result: Original analysis result
         """
-        print("\n" + "-" * 60)
-        print("  EXECUTING ACTIONS")
-        print("-" * 60)
-
-        for action in actions:
-            try:
-                if action['type'] == 'send_reply':
-                    self.execute_send_reply(action, result)
-                elif action['type'] == 'create_task':
-                    self.execute_create_task(action, result)
-
-                print(f"SUCCESS: {action['description']}")
-
-            except Exception as e:
-                print(f"ERROR: Failed to execute {action['description']} - {e}")
-
-        # Log execution
-        self.log_execution(actions, result)
+        print(_EXECUTING_BANNER)
 
-    def execute_send_reply(self, action: dict, result: dict):
-        """Execute send reply action (creates draft)"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"reply_draft_{timestamp}.txt"
-        output_path = VAULT_ACTIONS / filename
+        actions_file = VAULT_ACTIONS / f"actions_{datetime.now().strftime('%Y%m%d')}.jsonl"
 
-        content = f"""Reply Draft
-Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
-To: {action['data']['recipient']}
-Priority: {result.get('priority', 'MEDIUM')}
+        with open(actions_file, 'ab', buffering=65536) as out:
+            for action in actions:
+                try:
+                    if action['type'] == 'send_reply':
+                        self.execute_send_reply(action, result, out)
+                    elif action['type'] == 'create_task':
+                        self.execute_create_task(action, result, out)
 
----
+                    print(f"SUCCESS: {action['description']}")
 
-{action['data']['reply']}
+                except Exception as e:
+                    print(f"ERROR: Failed to execute {action['description']} - {e}")
 
----
+            out.flush()
+            os.fsync(out.fileno())
 
-Note: This is a draft. Review and send manually.
-"""
-
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-
-        print(f"  -> Draft saved: {output_path}")
-
-    def execute_create_task(self, action: dict, result: dict):
-        """Execute create task action"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"task_{timestamp}.txt"
-        output_path = VAULT_ACTIONS / filename
-
-        content = f"""Task
-Created: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
-Priority: {action['data']['priority']}
+        # Log execution
+        self.log_execution(actions, result)
 
----
+    def execute_send_reply(self, action: dict, result: dict, out):
+        """Execute send reply action (appends a draft to the actions file)"""
+        draft = {
+            "type": "reply_draft",
+            "generated": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "to": action['data']['recipient'],
+            "priority": result.get('priority', 'MEDIUM'),
+            "reply": action['data']['reply'],
+            "note": "This is a draft. Review and send manually."
+        }
 
-{action['data']['task']}
+        out.write(orjson.dumps(draft, option=orjson.OPT_APPEND_NEWLINE))
 
----
+        print(f"  -> Draft saved: {out.name}")
 
-Source: {result.get('sender', 'Unknown')}
-Category: {result.get('category', 'other')}
-"""
+    def execute_create_task(self, action: dict, result: dict, out):
+        """Execute create task action (appends a task to the actions file)"""
+        task = {
+            "type": "task",
+            "created": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "priority": action['data']['priority'],
+            "task": action['data']['task'],
+            "source": result.get('sender', 'Unknown'),
+            "category": result.get('category', 'other')
+        }
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        out.write(orjson.dumps(task, option=orjson.OPT_APPEND_NEWLINE))
 
-        print(f"  -> Task created: {output_path}")
+        print(f"  -> Task created: {out.name}")
 
     def log_execution(self, actions: list, result: dict):
-        """Log action execution to audit log"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        log_file = VAULT_LOGS / f"execution_{timestamp}.json"
-
+        """Log action execution to audit log (one JSON line per run)"""
         log_entry = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": datetime.now(),  # orjson writes ISO 8601
             "sender": result.get('sender'),
             "priority": result.get('priority'),
             "category": result.get('category'),
@@ -414,8 +717,14 @@ Category: {result.get('category', 'other')}
             ]
         }
 
-        with open(log_file, 'w', encoding='utf-8') as f:
-            json.dump(log_entry, f, indent=2)
+        self._log_fh.write(orjson.dumps(log_entry, option=orjson.OPT_APPEND_NEWLINE))
+
+        # Sync in batches; shutdown() syncs the remainder
+        self._log_pending += 1
+        if self._log_pending >= LOG_FSYNC_EVERY:
+            self._log_fh.flush()
+            os.fsync(self._log_fh.fileno())
+            self._log_pending = 0
 
     def run_demo(self):
         """Run demo with sample message"""
@@ -435,7 +744,7 @@ Sarah (Finance Director)
         print("[BRONZE] Sample message received")
         print("[SILVER] Analyzing...\n")
 
-        result = self.analyze_with_skills(sample_message, "Sarah")
+        result = asyncio.run(self.analyze_with_skills(sample_message, "Sarah"))
         self.display_analysis(result)
 
         if result.get("actions"):
@@ -466,7 +775,7 @@ Sarah (Finance Director)
 
                 # Analyze message
                 print("\n[SILVER] Analyzing...")
-                result = self.analyze_with_skills(user_input)
+                result = asyncio.run(self.analyze_with_skills(user_input))
                 self.display_analysis(result)
 
                 # Approval flow
@@ -493,16 +802,19 @@ def main():
 
     orchestrator = FTEOrchestrator()
 
-    if args.demo:
-        orchestrator.run_demo()
-    elif args.whatsapp:
-        orchestrator.display_banner()
-        orchestrator.watch_whatsapp()
-    elif args.watch:
-        orchestrator.display_banner()
-        orchestrator.watch_folder()
-    else:
-        orchestrator.run_interactive()
+    try:
+        if args.demo:
+            orchestrator.run_demo()
+        elif args.whatsapp:
+            orchestrator.display_banner()
+            orchestrator.watch_whatsapp()
+        elif args.watch:
+            orchestrator.display_banner()
+            orchestrator.watch_folder()
+        else:
+            orchestrator.run_interactive()
+    finally:
+        orchestrator.shutdown()
 
 
 if __name__ == "__main__":
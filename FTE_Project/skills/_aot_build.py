@@ -0,0 +1,26 @@
+"""
+Ahead-of-time build of the skills' numba kernels
+Run once when building a deployment image, so the first request doesn't pay
+for JIT compilation:
+
+    python -m skills._aot_build
+
+Writes the skills_kernels extension module next to this file; summarizer
+uses it when present and falls back to numba's JIT, then to pure Python.
+Requires numba and setuptools at build time only.
+"""
+import os
+
+from numba.pycc import CC
+
+from ._kernels import top3
+
+cc = CC('skills_kernels')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+cc.export('topk3_i32', 'i8[:](i4[:])')(top3)
+
+
+if __name__ == "__main__":
+    cc.compile()
+    print(f"Built skills_kernels in {cc.output_dir}")
@@ -0,0 +1,23 @@
+"""
+Numeric kernels for the skills, written in the numba-compatible subset
+summarizer JIT-compiles them with numba; _aot_build.py compiles the same
+source ahead of time into the skills_kernels extension
+"""
+import numpy as np
+
+
+def top3(lengths):
+    """Indices of the three largest lengths, longest first (earliest wins ties, -1 pads)"""
+    top = np.full(3, -1, dtype=np.int64)
+    top_len = np.full(3, -1, dtype=np.int64)
+    for i in range(lengths.shape[0]):
+        length = lengths[i]
+        if length > top_len[2]:
+            slot = 2
+            while slot > 0 and length > top_len[slot - 1]:
+                top[slot] = top[slot - 1]
+                top_len[slot] = top_len[slot - 1]
+                slot -= 1
+            top[slot] = i
+            top_len[slot] = length
+    return top
@@ -0,0 +1,124 @@
+"""
+Shared keyword tables and compiled matchers for the text skills
+Built once at import so the reply suggester, task extractor and summarizer
+don't each compile their own on first use
+"""
+import re
+
+# Optional: single-pass multi-keyword matching
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+# --- Task extractor ---
+
+# Patterns that indicate tasks
+TASK_PATTERNS = [
+    r'\b(please|need to|must|have to|should|could)\s+(do|complete|finish|send|review|check|prepare|submit|attend)\b',
+    r'\b(to do|todo|to-do|action item|next step|task|assignment)\b',
+    r'\b(by\s+\w+\s+\d{1,2}(?:st|nd|rd|th)?|before|after|when|tomorrow|today|later|ASAP|urgent)\b',
+    r'(call|email|contact|reach out|respond|reply|follow up|remind|inform|notify)',
+    r'(buy|purchase|order|get|obtain|arrange|schedule|book|setup|configure|install|update|change)'
+]
+
+# Common task-indicating words
+TASK_INDICATORS = [
+    'action', 'todo', 'task', 'complete', 'finish', 'do', 'perform', 'execute',
+    'attend', 'review', 'read', 'watch', 'learn', 'study', 'practice',
+    'buy', 'get', 'purchase', 'order', 'request', 'apply', 'register',
+    'make', 'create', 'draft', 'write', 'edit', 'proofread', 'submit',
+    'organize', 'arrange', 'prepare', 'plan', 'think about', 'decide'
+]
+
+# The task patterns are fused so each line is scanned once
+TASK_RE = re.compile("|".join(f"(?:{pattern})" for pattern in TASK_PATTERNS), re.IGNORECASE)
+SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
+# Leading bullet point, then leading list number
+BULLET_RE = re.compile(r'^(?:[-*•]\s*)?(?:\d+\.\s*)?')
+SENTENCE_BULLET_RE = re.compile(r'^[-*•]\s*')
+TASK_WORD_RE = re.compile(r'\w+')
+
+# Indicators are matched as whole words; phrases fall back to a substring test
+INDICATORS = frozenset(word for word in TASK_INDICATORS if ' ' not in word)
+INDICATOR_PHRASES = tuple(word for word in TASK_INDICATORS if ' ' in word)
+
+# Deadline words, matched anywhere in the lowercased text
+DEADLINE_TOKENS = ('by', 'before', 'until', 'due', 'tomorrow', 'today', 'tonight', 'week', 'month', 'asap')
+SENTENCE_DEADLINE_TOKENS = ('by', 'before', 'tomorrow', 'today', 'due')
+
+
+# --- Reply suggester ---
+
+# Message type keywords, in priority order (first type that matches wins).
+# Requests come before problems, as "can you help" should be request not problem
+MESSAGE_TYPE_KEYWORDS = [
+    ("greeting", ["hi", "hello", "hey", "good morning", "good afternoon", "good evening"]),
+    ("request", ["can you", "could you", "please", "need you to", "would you", "request"]),
+    ("problem", ["issue", "problem", "error", "bug", "broken", "not working", "fix"]),
+    ("urgent", ["urgent", "asap", "immediately", "now"]),
+    ("question", ["question", "ask", "wonder", "?"]),
+    ("meeting", ["meeting", "appointment", "schedule", "when", "time"]),
+    ("appreciation", ["thank", "thanks", "appreciate"]),
+    ("compliment", ["congrat", "well done", "great job"]),
+]
+
+
+def _prune_keywords():
+    """
+    Drop keywords that can never change the result
+
+    A keyword containing another keyword of the same or higher priority
+    (e.g. "thanks" and "thank") always matches alongside it, so only the
+    shorter one needs to be searched for.
+    """
+    ranked = [
+        (rank, keyword)
+        for rank, (_, keywords) in enumerate(MESSAGE_TYPE_KEYWORDS)
+        for keyword in keywords
+    ]
+    pruned = []
+    for message_type, keywords in MESSAGE_TYPE_KEYWORDS:
+        rank = len(pruned)
+        pruned.append((message_type, [
+            keyword for keyword in keywords
+            if not any(
+                other != keyword and other in keyword and other_rank <= rank
+                for other_rank, other in ranked
+            )
+        ]))
+    return pruned
+
+
+REPLY_KEYWORDS = _prune_keywords()
+
+
+def _build_reply_automaton():
+    """
+    Build one Aho-Corasick automaton mapping each keyword to (rank, message type)
+
+    The automaton is a trie over all keywords, so shared prefixes such as
+    "good " are walked once per position.
+    """
+    automaton = ahocorasick.Automaton()
+    for rank, (message_type, keywords) in enumerate(REPLY_KEYWORDS):
+        for keyword in keywords:
+            automaton.add_word(keyword, (rank, message_type))
+    automaton.make_automaton()
+    return automaton
+
+
+REPLY_AC = _build_reply_automaton() if AHOCORASICK_AVAILABLE else None
+
+
+# --- Summarizer ---
+
+# Lines containing these words are reported as key points
+KEY_POINT_WORDS = ['important', 'urgent', 'key', 'critical', 'main']
+
+# Words never reported as keywords
+STOP_WORDS = frozenset(['the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'])
+
+SUMMARY_WORD_RE = re.compile(r"[\w'-]+")
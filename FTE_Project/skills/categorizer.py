@@ -2,57 +2,188 @@
 Categorizer Skill for Bronze-level Personal AI Employee
 Classifies content into categories (work/personal/study/finance/other)
 """
-
-def categorize_content(content, return_structured=False):
+import re
+from collections import Counter
+
+# Optional: numpy, needed by both accelerated scoring paths below
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Optional: JIT-compiled scoring for long messages
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Optional: vectorized scoring for batches of messages
+try:
+    from sklearn.feature_extraction.text import CountVectorizer
+    SKLEARN_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    SKLEARN_AVAILABLE = False
+
+# Define category keywords
+CATEGORY_KEYWORDS = {
+    "work": [
+        "meeting", "colleague", "boss", "company", "project", "client", "deadline",
+        "report", "presentation", "office", "team", "department", "employee", "employer",
+        "schedule", "calendar", "work", "business", "corporate", "professional",
+        "performance", "review", "task", "assignment", "agenda", "conference"
+    ],
+    "personal": [
+        "family", "friend", "parent", "child", "wife", "husband", "spouse", "relative",
+        "birthday", "celebration", "vacation", "holiday", "weekend", "dinner", "party",
+        "social", "personal", "relationship", "home", "hobby", "leisure", "fun"
+    ],
+    "study": [
+        "lecture", "professor", "student", "assignment", "homework", "exam", "test",
+        "course", "class", "school", "university", "college", "education", "learning",
+        "research", "thesis", "paper", "study", "academic", "grade", "degree", "campus"
+    ],
+    "finance": [
+        "money", "payment", "bill", "invoice", "bank", "account", "credit", "debit",
+        "budget", "expense", "investment", "loan", "tax", "refund", "fee", "cost",
+        "price", "financial", "finances", "cash", "salary", "income", "revenue"
+    ]
+}
+
+# Display labels, computed once
+_CATEGORY_UPPER = {category: category.upper() for category in [*CATEGORY_KEYWORDS, "other"]}
+
+# Lowercase word tokens; keywords match whole words only
+_WORD_RE = re.compile(r"[a-z']+")
+
+_CATEGORY_SETS = {category: frozenset(keywords) for category, keywords in CATEGORY_KEYWORDS.items()}
+
+# Messages longer than this use the compiled kernel when numba is available
+NUMBA_MIN_CHARS = 2000
+
+if NUMBA_AVAILABLE:
+    # Keyword -> column id, and a category x keyword membership table
+    _KEYWORD_IDS = {}
+    for _keywords in CATEGORY_KEYWORDS.values():
+        for _keyword in _keywords:
+            _KEYWORD_IDS.setdefault(_keyword, len(_KEYWORD_IDS))
+
+    _MEMBERSHIP = np.zeros((len(CATEGORY_KEYWORDS), len(_KEYWORD_IDS)), dtype=np.uint8)
+    for _row, _keywords in enumerate(CATEGORY_KEYWORDS.values()):
+        for _keyword in _keywords:
+            _MEMBERSHIP[_row, _KEYWORD_IDS[_keyword]] = 1
+
+    @njit(cache=True, parallel=True)
+    def _score_kernel(token_ids, membership):
+        """Per-category keyword counts for integer-encoded tokens (-1 = not a keyword)"""
+        n_categories = membership.shape[0]
+        scores = np.zeros(n_categories, dtype=np.int64)
+        for c in range(n_categories):
+            total = 0
+            for i in prange(token_ids.shape[0]):
+                token_id = token_ids[i]
+                if token_id >= 0:
+                    total += membership[c, token_id]
+            scores[c] = total
+        return scores
+
+if SKLEARN_AVAILABLE:
+    # Term-document counts over the keyword vocabulary, tokenized like _WORD_RE
+    _VOCABULARY = list(dict.fromkeys(kw for kws in CATEGORY_KEYWORDS.values() for kw in kws))
+    _VECTORIZER = CountVectorizer(vocabulary=_VOCABULARY, token_pattern=r"[a-z']+", lowercase=True)
+
+    # Category x keyword indicator matrix
+    _CATEGORY_MATRIX = np.zeros((len(CATEGORY_KEYWORDS), len(_VOCABULARY)), dtype=np.int64)
+    for _row, _keywords in enumerate(CATEGORY_KEYWORDS.values()):
+        for _keyword in _keywords:
+            _CATEGORY_MATRIX[_row, _VOCABULARY.index(_keyword)] = 1
+
+
+def categorize_content(content, return_structured=False, content_lower=None):
     """
     Classify content into predefined categories
 
     Args:
         content (str): The content to categorize
         return_structured (bool): If True, return simplified dict for agent use
+        content_lower (str): Lowercased content, if the caller already has it
 
     Returns:
         dict: Dictionary containing category and confidence score
     """
-    content_lower = content.lower()
-
-    # Define category keywords
-    categories = {
-        "work": [
-            "meeting", "colleague", "boss", "company", "project", "client", "deadline",
-            "report", "presentation", "office", "team", "department", "employee", "employer",
-            "schedule", "calendar", "work", "business", "corporate", "professional",
-            "performance", "review", "task", "assignment", "agenda", "conference"
-        ],
-        "personal": [
-            "family", "friend", "parent", "child", "wife", "husband", "spouse", "relative",
-            "birthday", "celebration", "vacation", "holiday", "weekend", "dinner", "party",
-            "social", "personal", "relationship", "home", "hobby", "leisure", "fun"
-        ],
-        "study": [
-            "lecture", "professor", "student", "assignment", "homework", "exam", "test",
-            "course", "class", "school", "university", "college", "education", "learning",
-            "research", "thesis", "paper", "study", "academic", "grade", "degree", "campus"
-        ],
-        "finance": [
-            "money", "payment", "bill", "invoice", "bank", "account", "credit", "debit",
-            "budget", "expense", "investment", "loan", "tax", "refund", "fee", "cost",
-            "price", "financial", "finances", "cash", "salary", "income", "revenue"
-        ]
-    }
+    content_lower = content_lower or content.lower()
 
     # Count occurrences of category-specific words
-    scores = {}
-    for category, keywords in categories.items():
-        count = sum(content_lower.count(keyword) for keyword in keywords)
-        scores[category] = count
+    tokens = _WORD_RE.findall(content_lower)
+    if NUMBA_AVAILABLE and len(content) > NUMBA_MIN_CHARS:
+        token_ids = np.fromiter(
+            (_KEYWORD_IDS.get(token, -1) for token in tokens),
+            dtype=np.int64,
+            count=len(tokens)
+        )
+        category_scores = _score_kernel(token_ids, _MEMBERSHIP)
+        scores = {
+            category: int(score)
+            for category, score in zip(CATEGORY_KEYWORDS, category_scores)
+        }
+    else:
+        counts = Counter(tokens)
+        scores = {
+            category: sum(counts[keyword] for keyword in keywords)
+            for category, keywords in _CATEGORY_SETS.items()
+        }
 
+    return _build_result(scores, len(tokens), return_structured)
+
+
+def categorize_batch(messages, return_structured=False):
+    """
+    Classify many messages at once
+
+    With scikit-learn installed, keyword counts for the whole batch come from
+    one sparse term-document matrix and a single matrix product; otherwise
+    each message goes through categorize_content.
+
+    Args:
+        messages (list): The contents to categorize
+        return_structured (bool): If True, return simplified dicts for agent use
+
+    Returns:
+        list: One categorize_content-style dict per message, in input order
+    """
+    if not SKLEARN_AVAILABLE:
+        return [categorize_content(message, return_structured) for message in messages]
+
+    # (messages x keywords) @ (keywords x categories) -> (messages x categories)
+    counts = _VECTORIZER.transform(messages)
+    batch_scores = np.asarray(counts @ _CATEGORY_MATRIX.T)
+
+    results = []
+    for message, row in zip(messages, batch_scores):
+        scores = {category: int(score) for category, score in zip(CATEGORY_KEYWORDS, row)}
+        total_words = len(_WORD_RE.findall(message.lower()))
+        results.append(_build_result(scores, total_words, return_structured))
+    return results
+
+
+def _build_result(scores, total_words, return_structured):
+    """
+    Pick the category from keyword scores and format the result
+
+    Args:
+        scores (dict): Keyword count per category
+        total_words (int): Number of word tokens in the content
+        return_structured (bool): If True, return simplified dict for agent use
+
+    Returns:
+        dict: Dictionary containing category and confidence score
+    """
     # Determine the highest scoring category
     max_category = max(scores, key=scores.get)
     max_score = scores[max_category]
 
     # Calculate confidence based on total word count
-    total_words = len(content.split())
     confidence = min(max_score / max(total_words * 0.1, 1), 1.0) if total_words > 0 else 0.5
 
     # If no strong indicator found, assign to "other"
@@ -80,7 +211,7 @@ def categorize_content(content, return_structured=False):
     # Format output
     category_output = f"""# Category Classification
 
-## Primary Category: {max_category.upper()}
+## Primary Category: {_CATEGORY_UPPER[max_category]}
 
 ### Confidence Score: {confidence:.2f}
 
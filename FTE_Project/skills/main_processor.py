@@ -11,7 +11,7 @@ from .priority_detector import detect_priority
 from .categorizer import categorize_content
 from .reply_suggester import suggest_reply
 from .task_extractor import extract_tasks
-from .utils import write_analysis_output
+from .utils import write_analysis_output_async
 
 
 def process_content(content, original_filename, sender=None):
@@ -31,42 +31,41 @@ def process_content(content, original_filename, sender=None):
     # Ensure the output directory exists
     os.makedirs(output_dir, exist_ok=True)
 
-    generated_files = []
+    # Writes run in the background while the next skill computes
+    pending_writes = []
 
     # Generate summary
     summary_content = generate_summary(content)
-    summary_path = write_analysis_output(
+    pending_writes.append(write_analysis_output_async(
         output_dir, original_filename, "Summary", summary_content
-    )
-    generated_files.append(summary_path)
+    ))
 
     # Detect priority
     priority_result = detect_priority(content)
-    priority_path = write_analysis_output(
+    pending_writes.append(write_analysis_output_async(
         output_dir, original_filename, "Priority", priority_result["analysis"]
-    )
-    generated_files.append(priority_path)
+    ))
 
     # Categorize content
     category_result = categorize_content(content)
-    category_path = write_analysis_output(
+    pending_writes.append(write_analysis_output_async(
         output_dir, original_filename, "Category", category_result["analysis"]
-    )
-    generated_files.append(category_path)
+    ))
 
     # Suggest replies
     reply_content = suggest_reply(content, sender)
-    reply_path = write_analysis_output(
+    pending_writes.append(write_analysis_output_async(
         output_dir, original_filename, "Reply_Suggestions", reply_content
-    )
-    generated_files.append(reply_path)
+    ))
 
     # Extract tasks
     task_content = extract_tasks(content)
-    task_path = write_analysis_output(
+    pending_writes.append(write_analysis_output_async(
         output_dir, original_filename, "Extracted_Tasks", task_content
-    )
-    generated_files.append(task_path)
+    ))
+
+    # Wait for every write; re-raises any write error
+    generated_files = [future.result() for future in pending_writes]
 
     return generated_files
 
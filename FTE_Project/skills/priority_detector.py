@@ -2,35 +2,95 @@
 Priority Detector Skill for Bronze-level Personal AI Employee
 Analyzes content to detect urgency level (urgent/normal/low)
 """
+import re
 
-def detect_priority(content, return_structured=False):
+# Optional: single-pass multi-keyword matching
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Define priority indicators
+URGENT_INDICATORS = [
+    'urgent', 'asap', 'immediately', 'right now', 'today', 'within hours',
+    'crucial', 'critical', 'emergency', 'deadline', 'cannot wait',
+    'high priority', 'top priority', 'priority 1', 'time sensitive'
+]
+
+LOW_INDICATORS = [
+    'whenever', 'whenever convenient', 'take your time', 'optional',
+    'nice to have', 'eventually', 'someday', 'not urgent', 'whenever possible'
+]
+
+TIME_SENSITIVE_WORDS = ['tomorrow', 'meeting', 'due', 'report', 'review']
+
+
+def _build_automaton():
+    """Build one Aho-Corasick automaton keyed by indicator class"""
+    automaton = ahocorasick.Automaton()
+    for indicator_class, indicators in (("urgent", URGENT_INDICATORS), ("low", LOW_INDICATORS)):
+        for indicator in indicators:
+            automaton.add_word(indicator, (indicator_class, indicator))
+    automaton.make_automaton()
+    return automaton
+
+
+def _build_regex(indicators):
+    """
+    Build one alternation finding indicators at every position
+
+    Longest indicators come first; the returned map credits each match with
+    the indicators it contains, so every distinct indicator is still counted.
+    """
+    ordered = sorted(indicators, key=len, reverse=True)
+    pattern = re.compile("(?=(" + "|".join(map(re.escape, ordered)) + "))")
+    implied = {
+        indicator: [other for other in indicators if other in indicator]
+        for indicator in indicators
+    }
+    return pattern, implied
+
+
+def _count_distinct(pattern, implied, text):
+    """Count distinct indicators found in text"""
+    found = set()
+    for match in pattern.findall(text):
+        found.update(implied[match])
+    return len(found)
+
+
+_AC = _build_automaton() if AHOCORASICK_AVAILABLE else None
+_URGENT_RE, _URGENT_IMPLIED = _build_regex(URGENT_INDICATORS)
+_LOW_RE, _LOW_IMPLIED = _build_regex(LOW_INDICATORS)
+_TIME_SENSITIVE = frozenset(TIME_SENSITIVE_WORDS)
+
+
+def detect_priority(content, return_structured=False, content_lower=None):
     """
     Analyze content to detect priority level
 
     Args:
         content (str): The content to analyze
         return_structured (bool): If True, return simplified dict for agent use
+        content_lower (str): Lowercased content, if the caller already has it
 
     Returns:
         dict: Dictionary containing priority level and confidence score
     """
-    content_lower = content.lower()
-
-    # Define priority indicators
-    urgent_indicators = [
-        'urgent', 'asap', 'immediately', 'right now', 'today', 'within hours',
-        'crucial', 'critical', 'emergency', 'deadline', 'cannot wait',
-        'high priority', 'top priority', 'priority 1', 'time sensitive'
-    ]
-
-    low_indicators = [
-        'whenever', 'whenever convenient', 'take your time', 'optional',
-        'nice to have', 'eventually', 'someday', 'not urgent', 'whenever possible'
-    ]
-
-    # Count indicators
-    urgent_count = sum(indicator in content_lower for indicator in urgent_indicators)
-    low_count = sum(indicator in content_lower for indicator in low_indicators)
+    content_lower = content_lower or content.lower()
+
+    # Count indicators (each distinct indicator counts once)
+    if _AC is not None:
+        # One linear pass over the content for both indicator classes
+        found = {"urgent": set(), "low": set()}
+        for _, (indicator_class, indicator) in _AC.iter(content_lower):
+            found[indicator_class].add(indicator)
+        urgent_count = len(found["urgent"])
+        low_count = len(found["low"])
+    else:
+        urgent_count = _count_distinct(_URGENT_RE, _URGENT_IMPLIED, content_lower)
+        low_count = _count_distinct(_LOW_RE, _LOW_IMPLIED, content_lower)
 
     # Determine priority based on counts
     if urgent_count > low_count:
@@ -43,12 +103,8 @@ def detect_priority(content, return_structured=False):
         priority = "normal"
         confidence = 0.6  # Default medium confidence for normal priority
 
-    # Additional context analysis
-    words = content.split()
-
     # Check for time-sensitive language
-    time_sensitive_words = ['tomorrow', 'meeting', 'due', 'report', 'review']
-    time_sensitive_count = sum(word.lower() in time_sensitive_words for word in words)
+    time_sensitive_count = sum(1 for token in content_lower.split() if token in _TIME_SENSITIVE)
 
     if time_sensitive_count > 2 and priority == "normal":
         priority = "normal_urgent"  # Medium-high priority
@@ -2,6 +2,83 @@
 Summarizer Skill for Bronze-level Personal AI Employee
 Generates concise summaries of incoming content with key points highlighted
 """
+import functools
+import heapq
+from collections import Counter
+
+# Relative inside the package; absolute when run directly as a script
+try:
+    from ._patterns import KEY_POINT_WORDS, STOP_WORDS, SUMMARY_WORD_RE
+except ImportError:
+    from _patterns import KEY_POINT_WORDS, STOP_WORDS, SUMMARY_WORD_RE
+
+# Optional: vectorized line filtering for documents with many lines
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Optional: compiled longest-line selection for long documents, either built
+# ahead of time by _aot_build.py or JIT-compiled by numba
+try:
+    from .skills_kernels import topk3_i32 as _top3_kernel
+    KERNEL_AVAILABLE = True
+except ImportError:
+    try:
+        from numba import njit
+        from ._kernels import top3
+        _top3_kernel = njit(cache=True)(top3)
+        KERNEL_AVAILABLE = True
+    except ImportError:
+        KERNEL_AVAILABLE = False
+
+# Content longer than this uses the compiled kernel when it is available
+KERNEL_MIN_CHARS = 2000
+
+# Content with at least this many lines is filtered with numpy array ops
+NUMPY_MIN_LINES = 100
+
+# numpy string arrays pad every line to the longest one; skip the array ops
+# when that would take more than this many times the content's own size
+NUMPY_MAX_PADDING = 4
+
+
+def _filter_lines_vectorized(lines):
+    """
+    Select overview lines and key points with numpy string array ops
+
+    Same selection as the line loop in _summary_parts, without a Python-level
+    iteration per line.
+
+    Returns:
+        tuple: (first three important lines, key point lines)
+    """
+    stripped = np.char.strip(np.array(lines, dtype=str))
+    lengths = np.char.str_len(stripped)
+    important = lengths > 50
+    for prefix in ('-', '*', '•', '#'):
+        important |= np.char.startswith(stripped, prefix)
+    important_idx = np.flatnonzero(important)
+
+    lowered = np.char.lower(stripped)
+    has_key_word = np.zeros(len(lines), dtype=bool)
+    for keyword in KEY_POINT_WORDS:
+        has_key_word |= np.char.find(lowered, keyword) >= 0
+    key_points = [f"- {line}" for line in stripped[has_key_word].tolist()]
+
+    # If no key points were identified, pick the longest lines as key points
+    if not key_points and important_idx.size:
+        important_lengths = lengths[important_idx]
+        if KERNEL_AVAILABLE:
+            top = _top3_kernel(important_lengths.astype(np.int32))
+            top = top[top >= 0]
+        else:
+            top = np.argsort(-important_lengths, kind='stable')[:3]
+        key_points = [f"- {line}" for line in stripped[important_idx[top]].tolist()]
+
+    return stripped[important_idx[:3]].tolist(), key_points
+
 
 def summarize_content(content, return_structured=False):
     """
@@ -17,58 +94,110 @@ def summarize_content(content, return_structured=False):
     return generate_summary(content, return_structured)
 
 
-def generate_summary(content, return_structured=False):
+@functools.lru_cache(maxsize=512)
+def _summary_parts(content):
     """
-    Generate a summary of the provided content
-
-    Args:
-        content (str): The content to summarize
-        return_structured (bool): If True, return dict instead of markdown
+    Compute the summary text, key points and keywords for content
 
-    Returns:
-        str or dict: Formatted summary with key points
+    Makes a single pass over the lines, or uses numpy array ops when there
+    are many lines. Cached per content, so repeated messages skip the scan.
+    Returns tuples so cached values can't be mutated by callers.
     """
-    # Simple implementation - in a real scenario, this could use more advanced NLP
     lines = content.split('\n')
+    if (
+        NUMPY_AVAILABLE
+        and len(lines) >= NUMPY_MIN_LINES
+        and len(lines) * max(map(len, lines)) <= NUMPY_MAX_PADDING * len(content)
+    ):
+        summary_lines, key_points = _filter_lines_vectorized(lines)
+        keyword_counts = Counter(
+            word for word in SUMMARY_WORD_RE.findall(content.lower())
+            if len(word) > 4 and word not in STOP_WORDS
+        )
+    else:
+        key_points = []
+        # First few important lines, for the overview
+        summary_lines = []
+        # Min-heap of the three longest important lines, for the key point fallback
+        longest = []
+        keyword_counts = Counter()
+        # Long documents keep every important line and pick the longest in the kernel
+        use_kernel = KERNEL_AVAILABLE and len(content) > KERNEL_MIN_CHARS
+        important_lines = []
+
+        for index, line in enumerate(lines):
+            line = line.strip()
+            if not line:
+                continue
+            line_lower = line.lower()
 
-    # Extract key points based on length and importance indicators
-    key_points = []
-    summary_lines = []
-
-    for i, line in enumerate(lines):
-        line = line.strip()
-        if line:
             # Add lines that seem important (longer lines or those starting with bullet points)
             if len(line) > 50 or line.startswith(('-', '*', '•', '#')):
-                summary_lines.append(line)
+                if len(summary_lines) < 3:
+                    summary_lines.append(line)
+                if use_kernel:
+                    important_lines.append(line)
+                else:
+                    entry = (len(line), -index, line)
+                    if len(longest) < 3:
+                        heapq.heappush(longest, entry)
+                    else:
+                        heapq.heappushpop(longest, entry)
 
             # Look for potential key points
-            if any(keyword in line.lower() for keyword in ['important', 'urgent', 'key', 'critical', 'main']):
+            if any(keyword in line_lower for keyword in KEY_POINT_WORDS):
                 key_points.append(f"- {line}")
 
-    # If no key points were identified, pick the longest lines as key points
-    if not key_points:
-        sorted_lines = sorted(summary_lines, key=len, reverse=True)
-        key_points = [f"- {line}" for line in sorted_lines[:min(3, len(sorted_lines))]]
+            keyword_counts.update(
+                word for word in SUMMARY_WORD_RE.findall(line_lower)
+                if len(word) > 4 and word not in STOP_WORDS
+            )
+
+        # If no key points were identified, pick the longest lines as key points
+        if not key_points:
+            if use_kernel:
+                lengths = np.fromiter(
+                    (len(line) for line in important_lines),
+                    dtype=np.int32,
+                    count=len(important_lines)
+                )
+                key_points = [f"- {important_lines[i]}" for i in _top3_kernel(lengths) if i >= 0]
+            else:
+                key_points = [f"- {line}" for _, _, line in sorted(longest, reverse=True)]
 
     # Create summary from first few lines if no specific important lines were found
     if not summary_lines:
-        words = content.split()
-        summary_text = ' '.join(words[:min(50, len(words))]) + ('...' if len(words) > 50 else '')
+        # Only the first 50 words are needed; a 51st part means there were more
+        words = content.split(None, 50)
+        summary_text = ' '.join(words[:50]) + ('...' if len(words) > 50 else '')
     else:
-        summary_text = ' '.join(summary_lines[:min(3, len(summary_lines))])
+        summary_text = ' '.join(summary_lines)
+
+    # Most frequent longer words are the keywords
+    keywords = [word for word, _ in keyword_counts.most_common(5)]
+
+    return summary_text, tuple(key_points), tuple(keywords)
 
-    # Extract keywords
-    words = content.lower().split()
-    common_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'}
-    keywords = [w for w in set(words) if len(w) > 4 and w not in common_words][:5]
+
+def generate_summary(content, return_structured=False):
+    """
+    Generate a summary of the provided content
+
+    Args:
+        content (str): The content to summarize
+        return_structured (bool): If True, return dict instead of markdown
+
+    Returns:
+        str or dict: Formatted summary with key points
+    """
+    summary_text, key_points, keywords = _summary_parts(content)
 
     # Return structured data if requested
     if return_structured:
         return {
             "summary": summary_text,
             "key_points": [kp.replace("- ", "") for kp in key_points] if key_points else [],
-            "keywords": keywords
+            "keywords": list(keywords)
         }
 
     # Format the summary as markdown
@@ -2,6 +2,39 @@
 Task Extractor Skill for Bronze-level Personal AI Employee
 Identifies possible todos/action items from messages
 """
+# Relative inside the package; absolute when run directly as a script
+try:
+    from ._patterns import (
+        TASK_RE,
+        SENTENCE_SPLIT_RE,
+        BULLET_RE,
+        SENTENCE_BULLET_RE,
+        TASK_WORD_RE,
+        INDICATORS,
+        INDICATOR_PHRASES,
+        DEADLINE_TOKENS,
+        SENTENCE_DEADLINE_TOKENS,
+    )
+except ImportError:
+    from _patterns import (
+        TASK_RE,
+        SENTENCE_SPLIT_RE,
+        BULLET_RE,
+        SENTENCE_BULLET_RE,
+        TASK_WORD_RE,
+        INDICATORS,
+        INDICATOR_PHRASES,
+        DEADLINE_TOKENS,
+        SENTENCE_DEADLINE_TOKENS,
+    )
+
+
+def _has_indicator(text_lower, tokens):
+    """Check whether lowercased text contains a task indicator word or phrase"""
+    if not tokens.isdisjoint(INDICATORS):
+        return True
+    return any(phrase in text_lower for phrase in INDICATOR_PHRASES)
+
 
 def extract_tasks(content, return_structured=False):
     """
@@ -16,26 +49,6 @@ def extract_tasks(content, return_structured=False):
         str or dict: Markdown-formatted list of extracted tasks (Bronze mode) or
                     structured dict with tasks (Silver mode)
     """
-    import re
-
-    # Define patterns that indicate tasks
-    task_patterns = [
-        r'\b(please|need to|must|have to|should|could)\s+(do|complete|finish|send|review|check|prepare|submit|attend)\b',
-        r'\b(to do|todo|to-do|action item|next step|task|assignment)\b',
-        r'\b(by\s+\w+\s+\d{1,2}(?:st|nd|rd|th)?|before|after|when|tomorrow|today|later|ASAP|urgent)\b',
-        r'(call|email|contact|reach out|respond|reply|follow up|remind|inform|notify)',
-        r'(buy|purchase|order|get|obtain|arrange|schedule|book|setup|configure|install|update|change)'
-    ]
-
-    # Common task-indicating words
-    task_indicators = [
-        'action', 'todo', 'task', 'complete', 'finish', 'do', 'perform', 'execute',
-        'attend', 'review', 'read', 'watch', 'learn', 'study', 'practice',
-        'buy', 'get', 'purchase', 'order', 'request', 'apply', 'register',
-        'make', 'create', 'draft', 'write', 'edit', 'proofread', 'submit',
-        'organize', 'arrange', 'prepare', 'plan', 'think about', 'decide'
-    ]
-
     # Lines that look like tasks
     potential_tasks = []
     lines = content.split('\n')
@@ -44,30 +57,37 @@ def extract_tasks(content, return_structured=False):
         line_clean = line.strip()
         if line_clean and not line_clean.startswith('#'):  # Exclude headers
             # Check if line matches any task pattern
-            matches_pattern = any(re.search(pattern, line_clean, re.IGNORECASE) for pattern in task_patterns)
-            has_indicator = any(indicator in line_clean.lower() for indicator in task_indicators)
+            matches_pattern = TASK_RE.search(line_clean) is not None
+            line_lower = line_clean.lower()
+            tokens = set(TASK_WORD_RE.findall(line_lower))
+            has_indicator = _has_indicator(line_lower, tokens)
 
             # Check if line contains action-indicating words and potentially a deadline
-            has_deadline = bool(re.search(r'(by|before|until|due|tomorrow|today|tonight|week|month|ASAP)', line_clean, re.IGNORECASE))
+            has_deadline = any(token in line_lower for token in DEADLINE_TOKENS)
 
             if matches_pattern or has_indicator or has_deadline:
                 # Clean up the line to make it more task-like
-                cleaned_line = re.sub(r'^[-*•]\s*', '', line_clean)  # Remove bullet points
-                cleaned_line = re.sub(r'^\d+\.\s*', '', cleaned_line)  # Remove numbered list items
+                cleaned_line = BULLET_RE.sub('', line_clean, count=1)  # Remove bullet points and list numbers
                 potential_tasks.append(cleaned_line)
 
-    # Additional processing to extract more implicit tasks
-    sentences = re.split(r'[.!?]+', content)
-    for sentence in sentences:
-        sentence = sentence.strip()
-        if len(sentence) > 10:  # Only consider meaningful sentences
-            has_indicator = any(indicator in sentence.lower() for indicator in task_indicators)
-            has_deadline = bool(re.search(r'(by|before|tomorrow|today|due)', sentence, re.IGNORECASE))
-
-            if has_indicator and has_deadline:
-                cleaned_sentence = re.sub(r'^[-*•]\s*', '', sentence)
-                if cleaned_sentence not in potential_tasks:
-                    potential_tasks.append(cleaned_sentence)
+    # Additional processing to extract more implicit tasks, only needed when
+    # the line pass found nothing or the content is a single line
+    if not potential_tasks or '\n' not in content:
+        seen = set(potential_tasks)
+        sentences = SENTENCE_SPLIT_RE.split(content)
+        for sentence in sentences:
+            sentence = sentence.strip()
+            if len(sentence) > 10:  # Only consider meaningful sentences
+                sentence_lower = sentence.lower()
+                tokens = set(TASK_WORD_RE.findall(sentence_lower))
+                has_indicator = _has_indicator(sentence_lower, tokens)
+                has_deadline = any(token in sentence_lower for token in SENTENCE_DEADLINE_TOKENS)
+
+                if has_indicator and has_deadline:
+                    cleaned_sentence = SENTENCE_BULLET_RE.sub('', sentence)
+                    if cleaned_sentence not in seen:
+                        seen.add(cleaned_sentence)
+                        potential_tasks.append(cleaned_sentence)
 
     # Silver mode: Return structured data for action preparation
     if return_structured:
@@ -97,17 +117,17 @@ def extract_tasks(content, return_structured=False):
     # Bronze mode: Return markdown-formatted output (default behavior)
     # Format the extracted tasks
     if potential_tasks:
-        tasks_output = "# Extracted Tasks\n\n## Possible Action Items:\n\n"
+        parts = ["# Extracted Tasks\n\n## Possible Action Items:\n\n"]
 
         for i, task in enumerate(potential_tasks, 1):
-            tasks_output += f"### Task {i}:\n- {task.strip()}\n\n"
+            parts.append(f"### Task {i}:\n- {task.strip()}\n\n")
     else:
-        tasks_output = "# Extracted Tasks\n\n## Possible Action Items:\n\nNo specific tasks were clearly identified in the content.\n\n## Tips for Task Identification:\n- Look for action words like 'do', 'complete', 'attend', 'review'\n- Check for deadlines or time-sensitive language\n- Identify requests or assignments\n- Consider follow-up actions needed\n"
+        parts = ["# Extracted Tasks\n\n## Possible Action Items:\n\nNo specific tasks were clearly identified in the content.\n\n## Tips for Task Identification:\n- Look for action words like 'do', 'complete', 'attend', 'review'\n- Check for deadlines or time-sensitive language\n- Identify requests or assignments\n- Consider follow-up actions needed\n"]
 
-    tasks_output += """## Review Needed:
-Please review these extracted potential tasks and determine which ones require action. Some may be informational rather than actionable. Prioritize based on importance and deadlines."""
+    parts.append("""## Review Needed:
+Please review these extracted potential tasks and determine which ones require action. Some may be informational rather than actionable. Prioritize based on importance and deadlines.""")
 
-    return tasks_output
+    return "".join(parts)
 
 
 if __name__ == "__main__":
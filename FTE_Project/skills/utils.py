@@ -4,8 +4,18 @@ Provides common functionality for file I/O and formatting
 """
 
 import os
+import time
 import datetime
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+# Maps characters invalid in filenames to underscores
+_FILENAME_TRANSLATE = str.maketrans({char: '_' for char in '<>:"/\\|?*'})
+
+# Background writers for analysis outputs; file writes release the GIL
+_IO_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="analysis-writer")
+
+# (epoch second, formatted string) of the last format_timestamp() call
+_TIMESTAMP_CACHE = (0, "")
 
 
 def read_file_content(file_path):
@@ -18,8 +28,9 @@ def read_file_content(file_path):
     Returns:
         str: Content of the file
     """
-    with open(file_path, 'r', encoding='utf-8') as file:
-        return file.read()
+    # Read whole and decode once; skips the text-mode decoder and newline translation
+    with open(file_path, 'rb') as file:
+        return file.read().decode('utf-8')
 
 
 def write_analysis_output(output_dir, original_filename, analysis_type, content):
@@ -36,11 +47,12 @@ def write_analysis_output(output_dir, original_filename, analysis_type, content)
         str: Path of the created file
     """
     # Create output directory if it doesn't exist
-    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    os.makedirs(output_dir, exist_ok=True)
 
     # Generate output filename
-    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-    base_name = Path(original_filename).stem
+    now = datetime.datetime.now()
+    timestamp = now.strftime("%Y%m%d_%H%M%S")
+    base_name = os.path.splitext(os.path.basename(original_filename))[0]
     output_filename = f"{base_name}_{analysis_type}_{timestamp}.md"
     output_path = os.path.join(output_dir, output_filename)
 
@@ -48,26 +60,51 @@ def write_analysis_output(output_dir, original_filename, analysis_type, content)
     header = f"""---
 original_file: {original_filename}
 analysis_type: {analysis_type}
-generated_at: {datetime.datetime.now().isoformat()}
+generated_at: {now.isoformat()}
 ---
 
 """
 
-    # Write content with header
+    # Write header then content, without joining them into one large string
     with open(output_path, 'w', encoding='utf-8') as file:
-        file.write(header + content)
+        file.write(header)
+        file.write(content)
 
     return output_path
 
 
+def write_analysis_output_async(output_dir, original_filename, analysis_type, content):
+    """
+    Write analysis output on a background thread
+
+    Takes the same arguments as write_analysis_output, so batches of
+    outputs can be written concurrently.
+
+    Returns:
+        concurrent.futures.Future: Resolves to the path of the created file
+    """
+    return _IO_POOL.submit(
+        write_analysis_output, output_dir, original_filename, analysis_type, content
+    )
+
+
 def format_timestamp():
     """
     Generate a formatted timestamp string
 
+    Calls within the same second reuse the previously formatted string.
+
     Returns:
         str: Formatted timestamp
     """
-    return datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    global _TIMESTAMP_CACHE
+    now = int(time.time())
+    second, formatted = _TIMESTAMP_CACHE
+    if now != second:
+        formatted = datetime.datetime.fromtimestamp(now).strftime("%Y-%m-%d %H:%M:%S")
+        # Replaced as one tuple so concurrent callers never see a mixed pair
+        _TIMESTAMP_CACHE = (now, formatted)
+    return formatted
 
 
 def safe_filename(filename):
@@ -81,9 +118,7 @@ def safe_filename(filename):
         str: Safe filename
     """
     # Replace invalid characters with underscores
-    invalid_chars = '<>:"/\\|?*'
-    for char in invalid_chars:
-        filename = filename.replace(char, '_')
+    filename = filename.translate(_FILENAME_TRANSLATE)
 
     # Limit length
     if len(filename) > 200:
@@ -1,26 +1,350 @@
 import os
 import time
+import queue
+import threading
+import hashlib
+import functools
 from datetime import datetime
+from pathlib import Path
 from playwright.sync_api import sync_playwright
-import json
+import orjson
+
+# Optional: compact, fixed-error-rate dedup of processed message ids
+try:
+    from pybloom_live import ScalableBloomFilter
+    BLOOM_AVAILABLE = True
+except ImportError:
+    BLOOM_AVAILABLE = False
+
+# Candidate selectors for each lookup. The first selector that matches
+# anything wins, so the order is part of the behaviour; the lists are tried in
+# order inside the page, so a lookup is still a single browser round-trip
+CHAT_SELECTORS = [
+    'div[tabindex="-1"][role="button"]',  # Most common chat item selector
+    'div[role="row"]',  # Alternative chat row selector
+    '[data-testid="chat-list-item"]',  # Chat list item
+    'div[tabindex="-1"]'  # General chat container
+]
+UNREAD_INDICATORS = [
+    '[data-testid="icon-unread"]',  # Unread icon
+    '[data-icon="chat-unread"]',  # Alternative unread icon
+    '[aria-label*="unread"]',  # ARIA labels with unread
+    '[class*="unread"]',  # Classes containing 'unread'
+    'span[style*="background"]'  # Sometimes unread badges have background color
+]
+NAME_SELECTORS = [
+    '[title]',  # Title attribute
+    'span[title]',  # Span with title
+    'div[title]',  # Div with title
+    'span[dir="auto"]',  # Auto-direction span
+    'div:nth-child(2) span:first-child',  # First span in second child div
+    'div span:first-child'  # First span in the chat element
+]
+MESSAGE_SELECTORS = [
+    'div.message-in span.selectable-text',  # Incoming messages
+    'div.copyable-text span',  # Copyable message text
+    'span[dir="ltr"]',  # Left-to-right text (incoming)
+    'div[data-pre-plain-text] span',  # Messages with sender info
+    'div[tabindex="-1"] span',  # General message spans
+    '.copyable-text'  # Copyable text elements
+]
+
+# Any unread indicator marks a chat as unread, so these are matched together
+UNREAD_SELECTOR = ', '.join(UNREAD_INDICATORS)
+
+# Any of these means WhatsApp is logged in and the main UI has rendered
+UI_READY_SELECTORS = [
+    'div[data-testid="chat-list"]',
+    'div[role="grid"]',
+    '[data-testid="default-user"]',
+    'span[title="New chat"]',
+    'div[aria-label="Chat list"]',
+    'div[tabindex="-1"][role="button"]'
+]
+UI_READY_SELECTOR = ', '.join(UI_READY_SELECTORS)
+# Time allowed for the QR-code login (the old one-selector-at-a-time waits added up to this)
+UI_READY_TIMEOUT_MS = 12 * 60 * 1000
+
+# Shared by the in-page scripts below: the elements under root matched by the
+# first selector in the list that matches anything, and that selector's index
+_FIRST_MATCH_JS = """
+    const firstMatch = (root, selectors) => {
+        for (let group = 0; group < selectors.length; group++) {
+            const found = root.querySelectorAll(selectors[group]);
+            if (found.length) return {elements: Array.from(found), group};
+        }
+        return {elements: [], group: -1};
+    };
+"""
+
+# Runs in the page: a cheap snapshot of the top chat rows, used to skip the
+# unread scan when nothing in the list changed since the last one
+CHAT_FINGERPRINT_ROWS = 40
+CHAT_FINGERPRINT_JS = """
+([chatSelectors, rows]) => {""" + _FIRST_MATCH_JS + """
+    return firstMatch(document, chatSelectors).elements
+        .slice(0, rows)
+        .map(chat => chat.getAttribute('aria-label') || chat.textContent)
+        .join('|');
+}
+"""
+
+# Runs in the page: returns {group, unread} where group indexes the chat selector
+# that found the rows and unread is [{index, sender}] for each row that is (or
+# contains) an unread indicator and has a sender name, in list order.
+# The name selectors are tried in order until one yields text; only rows with no
+# name element fall back to the row's aria-label, cut at the first comma or line
+# break so unread counts and message previews don't become part of the sender
+SCAN_UNREAD_JS = """
+([chatSelectors, unreadSelector, nameSelectors]) => {""" + _FIRST_MATCH_JS + """
+    const {elements, group} = firstMatch(document, chatSelectors);
+    const unread = elements.map((chat, index) => {
+        if (!chat.matches(unreadSelector) && !chat.querySelector(unreadSelector)) return null;
+        let sender = '';
+        for (const selector of nameSelectors) {
+            const name = chat.querySelector(selector);
+            sender = name && name.innerText ? name.innerText.trim() : '';
+            if (sender) break;
+        }
+        if (!sender) sender = (chat.getAttribute('aria-label') || '').split(/[,\\n]/)[0].trim();
+        return sender ? {index, sender} : null;
+    }).filter(Boolean);
+    return {group, unread};
+}
+"""
+
+
+# Chat list element observed for changes, and the longest wait between scans
+CHAT_LIST_CONTAINER = '#pane-side, div[aria-label="Chat list"], div[data-testid="chat-list"]'
+CHANGE_WAIT_TIMEOUT_MS = 60000
+
+# Runs in the page: resolves once the chat list has changed since the last call,
+# or after timeoutMs. A persistent MutationObserver flags changes, so ones that
+# happen while Python is busy still wake the next wait immediately. If WhatsApp
+# re-rendered the list (reconnect, navigation), the observer is moved to the new
+# container and the wait returns at once, as the list may have changed unseen
+WAIT_FOR_CHANGE_JS = """
+([containerSelector, timeoutMs]) => new Promise(resolve => {
+    let watch = window.__fteWatch;
+    const container = document.querySelector(containerSelector) || document.body;
+    if (!watch || watch.container !== container || !watch.container.isConnected) {
+        if (watch) watch.observer.disconnect();
+        const observer = new MutationObserver(() => {
+            watch.changed = true;
+            if (watch.wake) watch.wake();
+        });
+        watch = window.__fteWatch = {changed: true, wake: null, container, observer};
+        observer.observe(container, {
+            childList: true,
+            subtree: true,
+            characterData: true,
+            attributes: true,
+            attributeFilter: ['aria-label', 'class']
+        });
+    }
+    if (watch.changed) {
+        watch.changed = false;
+        resolve(true);
+        return;
+    }
+    const timer = setTimeout(() => {
+        watch.wake = null;
+        resolve(false);
+    }, timeoutMs);
+    watch.wake = () => {
+        clearTimeout(timer);
+        watch.wake = null;
+        watch.changed = false;
+        resolve(true);
+    };
+})
+"""
+
+# Open conversation's message panel; message lookups are scoped to it
+CONVERSATION_PANEL = 'div[data-testid="conversation-panel-messages"], #main'
+CHAT_OPEN_TIMEOUT_MS = 5000
+
+# Runs in the page: the conversation panel once the clicked chat has replaced the
+# previous one (its header names the sender), else null so the wait keeps polling
+CHAT_OPENED_JS = """
+([panelSelector, sender]) => {
+    const panel = document.querySelector(panelSelector);
+    if (!panel) return null;
+    const header = document.querySelector('#main header');
+    return !header || header.innerText.includes(sender) ? panel : null;
+}
+"""
+
+# Runs in the page on the conversation panel: finds messages with the first
+# message selector that matches (incoming-only first, broad fallbacks after) and
+# returns the newest one's text and a per-message key from its bubble
+# (WhatsApp's data-id, else the data-pre-plain-text "[time, date] sender:"
+# prefix), or null if there are none
+LAST_MESSAGE_JS = """
+(panel, messageSelectors) => {""" + _FIRST_MATCH_JS + """
+    const messages = firstMatch(panel, messageSelectors).elements;
+    if (!messages.length) return null;
+    const message = messages[messages.length - 1];
+    const bubble = message.closest('[data-id]');
+    const prefixed = message.closest('[data-pre-plain-text]');
+    const key = bubble ? bubble.getAttribute('data-id')
+        : prefixed ? prefixed.getAttribute('data-pre-plain-text') : '';
+    return {text: message.innerText.trim(), key};
+}
+"""
+
+# Paths are resolved once from the script's location
+PROJECT_ROOT = Path(os.path.abspath(__file__)).parent.parent
+INPUT_DIR = PROJECT_ROOT / "input"  # Keep input dir for compatibility
+OUTPUT_DIR = PROJECT_ROOT / "vault" / "inbox"  # Updated to new structure
+PROFILE_DIR = PROJECT_ROOT / "playwright_profile"
+PROCESSED_LOG = PROFILE_DIR / "processed_messages.jsonl"
+
+# Maps spaces and characters invalid in filenames (including Windows-reserved ones) to underscores
+_SANITIZE = str.maketrans({char: '_' for char in ' /:|\\<>"*?'})
+
+
+@functools.lru_cache(maxsize=1024)
+def _safe_sender(sender):
+    """Sender name as used in inbox filenames; senders repeat, so each is sanitized once"""
+    return sender.translate(_SANITIZE)
+
+
+def message_filename(sender, now_ns):
+    """Markdown filename for a WhatsApp message; nanoseconds keep same-second messages apart"""
+    return f"whatsapp_{_safe_sender(sender)}_{now_ns}.md"
+
+
+# Processed message ids are remembered for at least this long (and at most twice as long)
+DEDUP_WINDOW_SECONDS = float(os.getenv("WHATSAPP_DEDUP_WINDOW", "86400"))
+
+
+def _new_processed_store():
+    """Membership store for processed message ids: a Bloom filter when available, else a set"""
+    if BLOOM_AVAILABLE:
+        return ScalableBloomFilter(initial_capacity=100_000, error_rate=1e-7)
+    return set()
+
+
+class ProcessedMessages:
+    """
+    Time-windowed record of processed message ids
+
+    Ids live in two generations of stores; once the current generation is a
+    window old it becomes the previous one and the oldest is dropped, so
+    memory stays bounded by the message rate. This works for Bloom filters,
+    which can't remove single entries. The JSONL log (one [timestamp, id]
+    pair per line) is compacted to the ids still remembered on startup and rotation.
+    """
+
+    def __init__(self, path, window_seconds=DEDUP_WINDOW_SECONDS):
+        self.path = path
+        self.window_seconds = window_seconds
+        self._previous = _new_processed_store()
+        self._current = _new_processed_store()
+        self._generation_start = time.time()
+        for message_id in self._compact_log(self._generation_start - window_seconds):
+            self._current.add(message_id)
+        self._log = open(self.path, 'ab')
+
+    def _compact_log(self, cutoff):
+        """Rewrite the log keeping only entries newer than cutoff; return their ids"""
+        kept = []
+        try:
+            with open(self.path, 'rb') as f:
+                for line in f:
+                    if line.strip():
+                        timestamp, message_id = orjson.loads(line)
+                        if timestamp >= cutoff:
+                            kept.append((timestamp, message_id))
+        except FileNotFoundError:
+            pass
+
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.writelines(orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE) for entry in kept)
+        os.replace(tmp_path, self.path)
+        return [message_id for _, message_id in kept]
+
+    def _rotate_if_due(self, now):
+        """Start a new generation once the current one is a window old"""
+        if now - self._generation_start < self.window_seconds:
+            return
+        # The log keeps what is still remembered: the generation becoming previous
+        self._log.close()
+        self._compact_log(self._generation_start)
+        self._previous = self._current
+        self._current = _new_processed_store()
+        self._generation_start = now
+        self._log = open(self.path, 'ab')
+
+    def __contains__(self, message_id):
+        self._rotate_if_due(time.time())
+        return message_id in self._current or message_id in self._previous
+
+    def add(self, message_id):
+        """Record a processed id in memory and in the log"""
+        now = time.time()
+        self._rotate_if_due(now)
+        self._current.add(message_id)
+        self._log.write(orjson.dumps([now, message_id], option=orjson.OPT_APPEND_NEWLINE))
+        self._log.flush()
+
+    def close(self):
+        """Close the log; every id is already on disk"""
+        self._log.close()
+
+
+# Chromium flags for every launch; the watcher only reads text, so skip the GPU
+BROWSER_ARGS = [
+    '--no-sandbox',
+    '--disable-setuid-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-web-security',
+    '--allow-running-insecure-content',
+    '--disable-extensions-http-throttling',
+    '--disable-ipc-flooding-protection',
+    '--disable-background-timer-throttling',
+    '--disable-renderer-backgrounding',
+    '--disable-gpu'
+]
+# Once nobody needs to see the page (headless after login), images aren't loaded either.
+# The visible QR-code login keeps them
+HEADLESS_BROWSER_ARGS = BROWSER_ARGS + ['--blink-settings=imagesEnabled=false']
+
+# After the QR-code login, reopen the saved profile headless so the browser never paints
+HEADLESS_AFTER_LOGIN = os.getenv("HEADLESS_AFTER_LOGIN", "false").lower() == "true"
+# Time allowed for an already logged-in profile to show the UI again
+RELAUNCH_READY_TIMEOUT_MS = 120000
+
+# Inbox files waiting for the writer thread; the scan loop blocks only when this fills
+WRITE_QUEUE_SIZE = 1024
+
+
+def _inbox_writer(write_queue):
+    """Write queued (path, payload bytes) pairs to disk, off the scanning thread"""
+    while True:
+        path, payload = write_queue.get()
+        try:
+            path.write_bytes(payload)
+        except OSError as e:
+            print(f"Failed to write {path.name}: {e}")
+        finally:
+            write_queue.task_done()
+
 
-def whatsapp_watcher():
+def whatsapp_watcher(on_message=None):
     """
     WhatsApp Web watcher that monitors for new messages and creates Markdown files
     in vault/Needs_Action/ with source, sender, timestamp, and raw message content.
-    """
-    # Use absolute paths based on the script's location
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    project_root = os.path.dirname(script_dir)  # Go up one level to project root
-
-    input_dir = os.path.join(project_root, "input")  # Keep input dir for compatibility
-    output_dir = os.path.join(project_root, "vault", "inbox")  # Updated to new structure
-    profile_dir = os.path.join(project_root, "playwright_profile")
 
+    Args:
+        on_message: Optional callback(sender, message_text, timestamp). When given,
+                    new messages are handed to it instead of written to the inbox.
+    """
     # Ensure directories exist
-    os.makedirs(input_dir, exist_ok=True)
-    os.makedirs(output_dir, exist_ok=True)
-    os.makedirs(profile_dir, exist_ok=True)
+    for directory in (INPUT_DIR, OUTPUT_DIR, PROFILE_DIR):
+        directory.mkdir(parents=True, exist_ok=True)
 
     print("Starting WhatsApp Web watcher...")
     print("Attempting to use persistent context...")
@@ -29,23 +353,13 @@ def whatsapp_watcher():
         # Create browser context once and keep it open
         try:
             context = p.chromium.launch_persistent_context(
-                profile_dir,
+                str(PROFILE_DIR),
                 headless=False,
                 viewport={'width': 1280, 'height': 800},
-                args=[
-                    '--no-sandbox',
-                    '--disable-setuid-sandbox',
-                    '--disable-dev-shm-usage',
-                    '--disable-web-security',
-                    '--allow-running-insecure-content',
-                    '--disable-extensions-http-throttling',
-                    '--disable-ipc-flooding-protection',
-                    '--disable-background-timer-throttling',
-                    '--disable-renderer-backgrounding',
-                    '--disable-features=VizDisplayCompositor'
-                ]
+                args=BROWSER_ARGS
             )
             page = context.new_page()
+            persistent = True
             print("Using persistent context (login will be saved)")
         except Exception as e:
             print(f"Failed to use persistent context: {str(e)}")
@@ -53,21 +367,11 @@ def whatsapp_watcher():
             # Fall back to regular browser
             browser = p.chromium.launch(
                 headless=False,
-                args=[
-                    '--no-sandbox',
-                    '--disable-setuid-sandbox',
-                    '--disable-dev-shm-usage',
-                    '--disable-web-security',
-                    '--allow-running-insecure-content',
-                    '--disable-extensions-http-throttling',
-                    '--disable-ipc-flooding-protection',
-                    '--disable-background-timer-throttling',
-                    '--disable-renderer-backgrounding',
-                    '--disable-features=VizDisplayCompositor'
-                ]
+                args=BROWSER_ARGS
             )
             context = browser.new_context(viewport={'width': 1280, 'height': 800})
             page = context.new_page()
+            persistent = False
 
         # Navigate to WhatsApp Web
         page.goto('https://web.whatsapp.com/')
@@ -79,25 +383,13 @@ def whatsapp_watcher():
         # Wait for WhatsApp main UI to load - use a variety of selectors
         print("Waiting for WhatsApp UI to load...")
 
-        # Try multiple selectors to detect when WhatsApp is ready
-        selectors_to_try = [
-            'div[data-testid="chat-list"]',
-            'div[role="grid"]',
-            '[data-testid="default-user"]',
-            'span[title="New chat"]',
-            'div[aria-label="Chat list"]',
-            'div[tabindex="-1"][role="button"]'
-        ]
-
-        ui_loaded = False
-        for selector in selectors_to_try:
-            try:
-                page.wait_for_selector(selector, timeout=120000)  # Wait up to 120 seconds
-                print("WhatsApp UI loaded successfully!")
-                ui_loaded = True
-                break
-            except:
-                continue
+        # Wait for any of the UI-ready markers in a single call
+        try:
+            page.wait_for_selector(UI_READY_SELECTOR, timeout=UI_READY_TIMEOUT_MS)
+            print("WhatsApp UI loaded successfully!")
+            ui_loaded = True
+        except Exception:
+            ui_loaded = False
 
         if not ui_loaded:
             print("Could not detect WhatsApp UI after waiting. Please make sure you're logged in.")
@@ -106,176 +398,171 @@ def whatsapp_watcher():
 
         print("Login detected. Starting message monitoring...")
 
-        # Track processed messages to prevent duplicates (file-based)
-        processed_messages_file = os.path.join(profile_dir, "processed_messages.json")
+        # The login is saved in the profile, so the same profile can be reopened headless.
+        # Reuse the visible browser's user agent: WhatsApp Web turns away "HeadlessChrome"
+        if HEADLESS_AFTER_LOGIN and persistent:
+            print("Reopening WhatsApp headless...")
+            user_agent = page.evaluate("navigator.userAgent").replace("HeadlessChrome", "Chrome")
+            context.close()
+            context = p.chromium.launch_persistent_context(
+                str(PROFILE_DIR),
+                headless=True,
+                user_agent=user_agent,
+                viewport={'width': 1280, 'height': 800},
+                args=HEADLESS_BROWSER_ARGS
+            )
+            page = context.new_page()
+            page.goto('https://web.whatsapp.com/')
+            try:
+                page.wait_for_selector(UI_READY_SELECTOR, timeout=RELAUNCH_READY_TIMEOUT_MS)
+            except Exception:
+                print("WhatsApp UI did not load headless. Run without HEADLESS_AFTER_LOGIN to log in again.")
+                context.close()
+                return
 
-        # Load previously processed messages
-        if os.path.exists(processed_messages_file):
-            with open(processed_messages_file, 'r') as f:
-                processed_messages = set(json.load(f))
-        else:
-            processed_messages = set()
+        # Track processed messages to prevent duplicates (windowed, log-backed)
+        processed_messages = ProcessedMessages(str(PROCESSED_LOG))
 
         print("Monitoring WhatsApp for new messages...")
         print("Browser stays open and continuously monitors for new messages...")
         print("Press Ctrl+C to stop the watcher.")
 
+        # Inbox files are written on a background thread
+        write_queue = queue.Queue(maxsize=WRITE_QUEUE_SIZE)
+        threading.Thread(
+            target=_inbox_writer, args=(write_queue,), name="whatsapp-inbox-writer", daemon=True
+        ).start()
+
+        # Chat rows are located through one Locator per candidate selector for the
+        # whole session; each is re-resolved on use, so it keeps up with the list
+        # re-rendering. The scan reports which candidate found the rows
+        chat_locators = [page.locator(selector) for selector in CHAT_SELECTORS]
+
+        last_fingerprint = None
+        # Set when a scan left an unread chat unhandled; the next scan then comes
+        # after a short pause instead of waiting for the list to change
+        retry_pending = False
+        # Last message (bubble key, text) seen per sender; re-reads of the same
+        # message stop here, before hashing or touching the processed log, while
+        # a repeated identical message has a new key and goes through
+        last_seen = {}
+
         try:
             while True:
-                # Every 5 seconds scan chat list for unread messages
-                time.sleep(5)
-
-                # Silently scan for unread messages (no print to avoid messy terminal)
-
-                # Try to find all chat items using various selectors
-                chat_selectors = [
-                    'div[tabindex="-1"][role="button"]',  # Most common chat item selector
-                    'div[role="row"]',  # Alternative chat row selector
-                    '[data-testid="chat-list-item"]',  # Chat list item
-                    'div[tabindex="-1"]'  # General chat container
-                ]
-
-                chat_elements = []
-                for selector in chat_selectors:
+                # Sleep until the chat list changes (or a minute passes), then scan it
+                if retry_pending:
+                    time.sleep(5)
+                else:
                     try:
-                        elements = page.query_selector_all(selector)
-                        if elements:
-                            chat_elements = elements
-                            break
-                    except:
-                        continue
-
-                if not chat_elements:
-                    # Silently skip if no chat elements found
+                        page.evaluate(
+                            WAIT_FOR_CHANGE_JS, [CHAT_LIST_CONTAINER, CHANGE_WAIT_TIMEOUT_MS]
+                        )
+                    except Exception:
+                        # Page navigated or closed mid-wait; fall back to a short pause
+                        time.sleep(5)
+
+                # Skip the scan entirely if the top of the chat list looks the same
+                try:
+                    snapshot = page.evaluate(
+                        CHAT_FINGERPRINT_JS, [CHAT_SELECTORS, CHAT_FINGERPRINT_ROWS]
+                    )
+                    fingerprint = hashlib.blake2b(snapshot.encode(), digest_size=8).digest()
+                except Exception:
+                    fingerprint = None
+                if fingerprint is not None and fingerprint == last_fingerprint:
                     continue
 
-                # Silently check chat elements (removed print to keep terminal clean)
+                # Silently scan for unread messages (no print to avoid messy terminal)
 
-                for i, chat_element in enumerate(chat_elements):
+                # Find unread chats and their senders in one in-page pass
+                all_handled = True
+                try:
+                    scan = page.evaluate(
+                        SCAN_UNREAD_JS, [CHAT_SELECTORS, UNREAD_SELECTOR, NAME_SELECTORS]
+                    )
+                    unread_chats = scan['unread']
+                    chat_locator = chat_locators[scan['group']]
+                except Exception:
+                    unread_chats = []
+                    all_handled = False
+
+                for chat in unread_chats:
+                    sender = chat['sender']
+                    # Silently process unread message (removed print to keep terminal clean)
+
+                    # Click on the chat to open it
                     try:
-                        # Check if this chat has an unread indicator
-                        # Look for various possible unread indicators
-                        unread_indicators = [
-                            '[data-testid="icon-unread"]',  # Unread icon
-                            '[data-icon="chat-unread"]',  # Alternative unread icon
-                            '[class*="unread"]',  # Classes containing 'unread'
-                            '[aria-label*="unread"]',  # ARIA labels with unread
-                            'span[style*="background"]'  # Sometimes unread badges have background color
-                        ]
-
-                        has_unread = False
-                        for indicator_selector in unread_indicators:
-                            try:
-                                if chat_element.query_selector(indicator_selector):
-                                    has_unread = True
-                                    break
-                            except:
-                                continue
-
-                        if has_unread:
-                            # Get sender name using multiple selectors
-                            sender = None
-                            name_selectors = [
-                                '[title]',  # Title attribute
-                                'span[title]',  # Span with title
-                                'div[title]',  # Div with title
-                                'span[dir="auto"]',  # Auto-direction span
-                                'div:nth-child(2) span:first-child',  # First span in second child div
-                                'div span:first-child'  # First span in the chat element
-                            ]
-
-                            for selector in name_selectors:
-                                try:
-                                    name_element = chat_element.query_selector(selector)
-                                    if name_element:
-                                        name_text = name_element.inner_text().strip()
-                                        if name_text and len(name_text) > 0:
-                                            sender = name_text
-                                            break
-                                except:
-                                    continue
-
-                            if sender:
-                                # Silently process unread message (removed print to keep terminal clean)
-
-                                # Click on the chat to open it
-                                try:
-                                    chat_element.click()
-                                    page.wait_for_timeout(2000)  # Wait for chat to load
-
-                                    # Get the most recent incoming message
-                                    # Look for messages that are not from the user (message-out)
-                                    message_selectors = [
-                                        'div.message-in span.selectable-text',  # Incoming messages
-                                        'div.copyable-text span',  # Copyable message text
-                                        'span[dir="ltr"]',  # Left-to-right text (incoming)
-                                        'div[data-pre-plain-text] span',  # Messages with sender info
-                                        'div[tabindex="-1"] span',  # General message spans
-                                        '.copyable-text'  # Copyable text elements
-                                    ]
-
-                                    message_text = ""
-                                    for msg_selector in message_selectors:
-                                        try:
-                                            message_elements = page.query_selector_all(msg_selector)
-                                            if message_elements:
-                                                # Get the last (most recent) message
-                                                last_message_element = message_elements[-1]
-                                                message_text = last_message_element.inner_text().strip()
-                                                if message_text and len(message_text) > 0:
-                                                    break
-                                        except:
-                                            continue
-
-                                    if message_text:
-                                        # Create a unique identifier for this message
-                                        message_id = f"{sender}_{message_text[:30]}_{datetime.now().strftime('%Y%m%d%H%M%S')}"
-
-                                        # Check if this message was already processed
-                                        if message_id not in processed_messages:
-                                            processed_messages.add(message_id)
-
-                                            # Save processed messages to file
-                                            with open(processed_messages_file, 'w') as f:
-                                                json.dump(list(processed_messages), f)
-
-                                            # Create a detailed timestamp
-                                            detailed_timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-                                            # Create markdown file
-                                            output_filename = f"whatsapp_{sender.replace(' ', '_').replace('/', '_').replace(':', '_').replace('|', '_').replace('\\', '_')}_{int(time.time())}.md"
-                                            output_path = os.path.join(output_dir, output_filename)
-
-                                            with open(output_path, 'w', encoding='utf-8') as f:
-                                                f.write(f"# WhatsApp Message\n\n")
-                                                f.write(f"**Source**: WhatsApp\n\n")
-                                                f.write(f"**Sender**: {sender}\n\n")
-                                                f.write(f"**Timestamp**: {detailed_timestamp}\n\n")
-                                                f.write("**Message**:\n")
-                                                f.write("```\n")
-                                                f.write(message_text)
-                                                f.write("\n```\n")
-
-                                            # Silently saved (removed print to keep terminal clean)
-                                        else:
-                                            # Silently skip already processed messages
-                                            pass
-
-                                    # Go back to chat list
-                                    page.wait_for_timeout(1000)
-                                    # Stay on the main page to continue monitoring
-                                    # We don't need to navigate back since we'll scan the chat list again
-
-                                except Exception as e:
-                                    # Silently handle errors to keep terminal clean
-                                    pass
+                        chat_locator.nth(chat['index']).click()
+
+                        # Wait for this chat's panel instead of sleeping a fixed time
+                        panel = page.wait_for_function(
+                            CHAT_OPENED_JS, arg=[CONVERSATION_PANEL, sender],
+                            timeout=CHAT_OPEN_TIMEOUT_MS
+                        ).as_element()
+
+                        # Get the most recent incoming message
+                        # Look for messages that are not from the user (message-out)
+                        try:
+                            last_message = panel.evaluate(LAST_MESSAGE_JS, MESSAGE_SELECTORS)
+                        finally:
+                            # Release the panel handle so long sessions don't accumulate them
+                            panel.dispose()
+                        message_text = last_message['text'] if last_message else ""
+                        message_key = last_message['key'] if last_message else ""
+
+                        if message_text and last_seen.get(sender) != (message_key, message_text):
+                            last_seen[sender] = (message_key, message_text)
+
+                            # Identify the message by its bubble key and content, so re-polling
+                            # the same unread message yields the same id while a repeated
+                            # "ok" from the same sender is still a new message
+                            message_id = hashlib.blake2b(
+                                f"{sender}\0{message_key}\0{message_text}".encode('utf-8'), digest_size=16
+                            ).hexdigest()
+
+                            # Check if this message was already processed
+                            if message_id not in processed_messages:
+                                processed_messages.add(message_id)
+
+                                # Read the clock once for both the timestamp and the filename
+                                now_ns = time.time_ns()
+                                detailed_timestamp = datetime.fromtimestamp(
+                                    now_ns // 1_000_000_000
+                                ).strftime("%Y-%m-%d %H:%M:%S")
+
+                                # Hand off directly to an in-process consumer
+                                if on_message:
+                                    on_message(sender, message_text, detailed_timestamp)
+                                else:
+                                    # Create markdown file
+                                    output_filename = message_filename(sender, now_ns)
+
+                                    payload = (
+                                        f"# WhatsApp Message\n\n"
+                                        f"**Source**: WhatsApp\n\n"
+                                        f"**Sender**: {sender}\n\n"
+                                        f"**Timestamp**: {detailed_timestamp}\n\n"
+                                        f"**Message**:\n```\n{message_text}\n```\n"
+                                    )
+                                    write_queue.put((OUTPUT_DIR / output_filename, payload.encode('utf-8')))
+
+                                    # Silently saved (removed print to keep terminal clean)
                             else:
-                                # Silently skip chats without sender name
+                                # Silently skip already processed messages
                                 pass
 
-                    except Exception as e:
-                        # Skip problematic chats silently
-                        continue
+                        # Stay on the main page to continue monitoring
+                        # We don't need to navigate back since we'll scan the chat list again
+
+                    except Exception:
+                        # Silently handle errors to keep terminal clean
+                        all_handled = False
+
+                # Only a fully handled list may be skipped next time; otherwise the
+                # unhandled chats are retried even if the list looks the same
+                if all_handled:
+                    last_fingerprint = fingerprint
+                retry_pending = not all_handled
 
                 # Silently wait before next scan (removed print to keep terminal clean)
 
@@ -283,9 +570,9 @@ def whatsapp_watcher():
             print("\nStopping WhatsApp watcher...")
 
         finally:
-            # Save processed messages before exiting
-            with open(processed_messages_file, 'w') as f:
-                json.dump(list(processed_messages), f)
+            # Let queued inbox files reach disk before shutting down
+            write_queue.join()
+            processed_messages.close()
             context.close()
             print("WhatsApp watcher stopped.")
 